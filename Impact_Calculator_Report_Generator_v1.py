@@ -4,85 +4,126 @@ import plotly.express as px
 import plotly.graph_objects as go
 from io import StringIO
 import base64
-import docx2txt
-import PyPDF2
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from sdg_toolkit.ingestion import UnsupportedFormatError, load_data as parse_upload
+from sdg_toolkit.impact import calculate_impact
+from chunked_loader import summarize_csv, summarize_dataframe
+from result_cache import ContentCache, content_hash
+from plot_reduction import DEFAULT_LIMITS, resolve_limits, bin_rows, decimate_rows, sample_rows, group_hierarchy
+from sdg_toolkit.profiling import instrument, stage, render_debug_panel
 
-def load_data(uploaded_file):
-    if uploaded_file is not None:
-        file_extension = uploaded_file.name.split('.')[-1].lower()
-        
-        if file_extension in ['csv', 'txt']:
-            df = pd.read_csv(uploaded_file)
-        elif file_extension in ['xlsx', 'xls']:
-            df = pd.read_excel(uploaded_file)
-        elif file_extension == 'pdf':
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            df = pd.DataFrame([text.split('\n')])
-        elif file_extension == 'docx':
-            text = docx2txt.process(uploaded_file)
-            df = pd.DataFrame([text.split('\n')])
-        else:
-            st.error(f"Unsupported file format: {file_extension}")
-            return None
-        
-        return df
-    return None
+# Uploads larger than this default to chunked (out-of-core) loading
+LARGE_FILE_BYTES = 50 * 1024 * 1024
 
-def calculate_impact(df):
-    # This is a placeholder function. In a real-world scenario,
-    # you would implement more sophisticated impact calculations here.
-    impact_score = df.sum().sum()  # Simple sum of all numeric values
-    return impact_score
+# PNG export for the report runs in a small thread pool; images are memoized per figure spec
+PNG_RENDER_WORKERS = 4
+PNG_CACHE_BYTES = 64 * 1024 * 1024
+
+# Function to get the per-process result cache; set IMPACT_CACHE_DIR to also keep results on disk
+@st.cache_resource
+def get_result_cache():
+    return ContentCache(disk_dir=os.environ.get('IMPACT_CACHE_DIR'))
+
+# Function to get the per-process cache of rendered report PNGs
+@st.cache_resource
+def get_png_cache():
+    return ContentCache(max_bytes=PNG_CACHE_BYTES)
+
+def load_data(uploaded_file, on_page=None):
+    try:
+        return parse_upload(uploaded_file, on_page)
+    except UnsupportedFormatError as e:
+        st.error(str(e))
+        return None
+
+# Function to load a large CSV/Excel upload into a running summary instead of one DataFrame
+@instrument("load_data.chunked")
+def load_data_chunked(uploaded_file, on_chunk=None):
+    file_extension = uploaded_file.name.split('.')[-1].lower()
+    if file_extension in ['csv', 'txt']:
+        return summarize_csv(uploaded_file, on_chunk=on_chunk)
+    if file_extension in ['xlsx', 'xls']:
+        # Excel can't be read in chunks; load it once and summarize with compact dtypes
+        return summarize_dataframe(pd.read_excel(uploaded_file))
+    return None
 
-def generate_visualizations(df):
+@instrument("generate_visualizations")
+def generate_visualizations(df, limits=None, scatter_method="random"):
     figs = []
+    # Large frames are reduced before plotting (see plot_reduction for the thresholds)
+    limits = resolve_limits(limits)
     
     # Sample visualization 1: Bar chart of numeric columns
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+    numeric_cols = df.select_dtypes(include='number').columns
     if len(numeric_cols) > 0:
-        fig = px.bar(df, y=numeric_cols, title="Impact Metrics")
+        bar_df, binned = bin_rows(df, numeric_cols, limits["bar"])
+        title = "Impact Metrics (binned means)" if binned else "Impact Metrics"
+        fig = px.bar(bar_df, y=numeric_cols, title=title)
         figs.append(fig)
     
     # Sample visualization 2: Scatter plot of two numeric columns
     if len(numeric_cols) >= 2:
-        fig = px.scatter(df, x=numeric_cols[0], y=numeric_cols[1], 
+        scatter_df, reduced = decimate_rows(df, numeric_cols[0], numeric_cols[1], limits["scatter"], scatter_method)
+        title = f"Correlation of Impact Metrics ({len(scatter_df):,} of {len(df):,} rows)" if reduced else "Correlation of Impact Metrics"
+        fig = px.scatter(scatter_df, x=numeric_cols[0], y=numeric_cols[1], 
                          size=numeric_cols[0], color=numeric_cols[1],
-                         hover_name=df.index, title="Correlation of Impact Metrics")
+                         hover_name=scatter_df.index, title=title)
         figs.append(fig)
     
     # Sample visualization 3: Sunburst chart (assuming categorical columns exist)
-    categorical_cols = df.select_dtypes(include=['object']).columns
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
     if len(categorical_cols) >= 2:
-        fig = px.sunburst(df, path=categorical_cols[:2], values=numeric_cols[0] if len(numeric_cols) > 0 else None,
+        sunburst_df, values, _ = group_hierarchy(df, categorical_cols[:2], numeric_cols[0] if len(numeric_cols) > 0 else None,
+                                                 limits["sunburst"])
+        fig = px.sunburst(sunburst_df, path=categorical_cols[:2], values=values,
                           title="Hierarchical View of Project Impact")
         figs.append(fig)
     
     # Sample visualization 4: 3D scatter plot
     if len(numeric_cols) >= 3:
-        fig = px.scatter_3d(df, x=numeric_cols[0], y=numeric_cols[1], z=numeric_cols[2],
+        scatter_df, reduced = sample_rows(df, limits["scatter_3d"])
+        title = f"3D View of Impact Metrics ({len(scatter_df):,} of {len(df):,} rows)" if reduced else "3D View of Impact Metrics"
+        fig = px.scatter_3d(scatter_df, x=numeric_cols[0], y=numeric_cols[1], z=numeric_cols[2],
                             color=numeric_cols[2], size=numeric_cols[0],
-                            title="3D View of Impact Metrics")
+                            title=title)
         figs.append(fig)
     
     return figs
 
-def generate_report(df, impact_score, figs):
+# Function to render one figure to PNG, memoized by the figure's JSON spec
+def render_figure_png(fig, png_cache):
+    spec_hash = hashlib.sha256(fig.to_json().encode('utf-8')).hexdigest()
+    return png_cache.get_or_compute(spec_hash, lambda: fig.to_image(format="png"))
+
+# Function to render figures to PNG concurrently, returning images in figure order
+def render_figures_png(figs):
+    # Looked up here, on the script thread, and handed to the render workers
+    png_cache = get_png_cache()
+    if len(figs) <= 1:
+        return [render_figure_png(fig, png_cache) for fig in figs]
+    with ThreadPoolExecutor(max_workers=min(PNG_RENDER_WORKERS, len(figs))) as executor:
+        return list(executor.map(lambda fig: render_figure_png(fig, png_cache), figs))
+
+@instrument("generate_report")
+def generate_report(df, impact_score, figs, summary=None):
+    if summary is None:
+        summary = df.describe()
     report = f"""
     # Project Impact Report
 
     ## Overall Impact Score: {impact_score:.2f}
 
     ## Data Summary
-    {df.describe().to_markdown()}
+    {summary.to_markdown()}
 
     ## Visualizations
     """
     
-    for i, fig in enumerate(figs, 1):
-        img_bytes = fig.to_image(format="png")
+    with stage("generate_report.png_export"):
+        images = render_figures_png(figs)
+    for i, img_bytes in enumerate(images, 1):
         img_base64 = base64.b64encode(img_bytes).decode('utf-8')
         report += f"\n\n### Visualization {i}\n![Visualization {i}](data:image/png;base64,{img_base64})\n"
     
@@ -92,28 +133,91 @@ def main():
     st.title("🚀 Impact Calculator and Report Generator")
     st.write("Upload your project data file to calculate impact and generate a detailed report with futuristic visualizations.")
 
+    render_debug_panel()
+
     uploaded_file = st.file_uploader("Choose a file", type=['csv', 'txt', 'xlsx', 'xls', 'pdf', 'docx'])
     
     if uploaded_file is not None:
-        df = load_data(uploaded_file)
+        cache = get_result_cache()
+        digest = content_hash(uploaded_file)
+
+        file_extension = uploaded_file.name.split('.')[-1].lower()
+        chunked = False
+        if file_extension in ['csv', 'txt', 'xlsx', 'xls']:
+            chunked = st.sidebar.checkbox(
+                "Large file mode (chunked loading)",
+                value=uploaded_file.size > LARGE_FILE_BYTES,
+                help="Read the file in chunks with compact dtypes. Statistics are computed incrementally and charts use a random sample of rows."
+            )
+
+        # Everything derived from the upload is cached by its content hash and the loading mode
+        found, data = cache.lookup((digest, 'data', chunked))
+        if not found:
+            if chunked:
+                rows_read = st.empty()
+                data = load_data_chunked(uploaded_file, on_chunk=lambda rows: rows_read.caption(f"Read {rows:,} rows..."))
+                rows_read.empty()
+            elif file_extension == 'pdf':
+                # Show extraction progress and a growing text preview while pages arrive
+                progress = st.progress(0.0, text="Extracting PDF pages...")
+                preview = st.empty()
+                preview_lines = []
+
+                def on_page(page_number, num_pages, page_text):
+                    if len(preview_lines) < 20:
+                        preview_lines.extend(line for line in page_text.split('\n') if line.strip())
+                        preview.text("\n".join(preview_lines[:20]))
+                    progress.progress(page_number / num_pages, text=f"Extracted page {page_number} of {num_pages}")
+
+                data = load_data(uploaded_file, on_page)
+                progress.empty()
+                preview.empty()
+            else:
+                data = load_data(uploaded_file)
+            if data is not None:
+                cache.put((digest, 'data', chunked), data)
+
+        summary = None
+        if chunked:
+            data_summary = data
+            df = data_summary.sample if data_summary is not None else None
+            if df is not None and data_summary.row_count > len(df):
+                st.info(f"Large file mode: {data_summary.row_count:,} rows summarized; charts show a random sample of {len(df):,} rows.")
+        else:
+            df = data
         
         if df is not None:
             st.subheader("Data Preview")
-            st.dataframe(df.head())
+            st.dataframe(data_summary.preview if chunked else df.head())
 
-            impact_score = calculate_impact(df)
+            if chunked:
+                impact_score = data_summary.impact_score
+                summary = cache.get_or_compute((digest, 'summary', chunked), data_summary.describe)
+            else:
+                impact_score = cache.get_or_compute((digest, 'impact', chunked), lambda: calculate_impact(df))
             st.subheader(f"Overall Impact Score: {impact_score:.2f}")
 
             st.subheader("Impact Visualizations")
-            figs = generate_visualizations(df)
+            with st.sidebar.expander("Chart settings"):
+                st.caption("Charts over larger data are binned, sampled or pre-grouped.")
+                limits = {
+                    name: st.number_input(f"Max rows: {name.replace('_', ' ')}", min_value=100, value=default, step=500)
+                    for name, default in DEFAULT_LIMITS.items()
+                }
+                scatter_method = st.selectbox("Scatter decimation", ["random", "lttb"],
+                                              help="Uniform random sample, or Largest-Triangle-Three-Buckets along the x axis")
+            plot_options = (tuple(sorted(limits.items())), scatter_method)
+            figs = cache.get_or_compute((digest, 'figs', chunked, plot_options), lambda: generate_visualizations(df, limits, scatter_method))
             for fig in figs:
                 st.plotly_chart(fig, use_container_width=True)
 
-            report = generate_report(df, impact_score, figs)
+            # The report (and its PNG export) is only built when the download is clicked
+            def build_report():
+                return cache.get_or_compute((digest, 'report', chunked, plot_options), lambda: generate_report(df, impact_score, figs, summary))
 
             st.download_button(
                 label="Download Full Report",
-                data=report,
+                data=build_report,
                 file_name="impact_report.md",
                 mime="text/markdown",
             )
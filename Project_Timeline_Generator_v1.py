@@ -1,44 +1,17 @@
+import os
 import streamlit as st
 from datetime import datetime, timedelta
+from io import BytesIO, StringIO
+from sdg_toolkit.registry import SDG_DATA
+from sdg_toolkit.timeline import generate_timeline
+from timeline_batch import PROJECT_COLUMNS, read_projects, validate_projects, generate_timelines, write_timelines
+from timeline_index import PhaseIndex, overloaded_months, gantt_figure
+from milestone_store import MilestoneStore, DEFAULT_DB_PATH
+import plotly.express as px
 
-def generate_timeline(project_name, start_date, duration, sdgs):
-    timeline = []
-    current_date = start_date
-    
-    # Initial phase
-    timeline.append({
-        "phase": "Project Initiation",
-        "start_date": current_date,
-        "end_date": current_date + timedelta(weeks=4),
-        "description": "Set up project team, define scope, and create detailed project plan.",
-        "sdgs": sdgs
-    })
-    current_date += timedelta(weeks=4)
-    
-    # Implementation phases
-    num_phases = max(1, duration // 3)  # At least one phase, then one phase per 3 months
-    phase_duration = timedelta(days=duration * 30 // num_phases)
-    
-    for i in range(num_phases):
-        timeline.append({
-            "phase": f"Implementation Phase {i+1}",
-            "start_date": current_date,
-            "end_date": current_date + phase_duration,
-            "description": f"Execute project activities related to {', '.join(sdgs[:2])}...",
-            "sdgs": sdgs
-        })
-        current_date += phase_duration
-    
-    # Final phase
-    timeline.append({
-        "phase": "Project Closure",
-        "start_date": current_date,
-        "end_date": current_date + timedelta(weeks=4),
-        "description": "Evaluate project outcomes, document lessons learned, and plan for sustainability.",
-        "sdgs": sdgs
-    })
-    
-    return timeline
+@st.cache_resource
+def get_milestone_store():
+    return MilestoneStore(os.environ.get('TIMELINE_DB_PATH', DEFAULT_DB_PATH))
 
 def main():
     st.title("📅 Project Timeline Generator")
@@ -47,32 +20,131 @@ def main():
     project_name = st.text_input("Project Name", "My SDG Project")
     start_date = st.date_input("Project Start Date", datetime.now())
     duration = st.slider("Project Duration (months)", 1, 36, 12)
-    sdgs = st.multiselect("Select relevant SDGs", [
-        "No Poverty", "Zero Hunger", "Good Health and Well-being", "Quality Education",
-        "Gender Equality", "Clean Water and Sanitation", "Affordable and Clean Energy",
-        "Decent Work and Economic Growth", "Industry, Innovation and Infrastructure",
-        "Reduced Inequality", "Sustainable Cities and Communities",
-        "Responsible Consumption and Production", "Climate Action", "Life Below Water",
-        "Life on Land", "Peace, Justice and Strong Institutions", "Partnerships for the Goals"
-    ])
+    sdgs = st.multiselect("Select relevant SDGs", list(SDG_DATA))
     
+    store = get_milestone_store()
+    saved_projects = store.list_projects()
+    if saved_projects:
+        col1, col2 = st.columns([3, 1])
+        saved = col1.selectbox("Open a saved plan", saved_projects)
+        if col2.button("Open Plan"):
+            st.session_state.timeline_project = saved
+
     if st.button("Generate Timeline"):
         if not sdgs:
             st.warning("Please select at least one SDG.")
         else:
             timeline = generate_timeline(project_name, start_date, duration, sdgs)
-            
-            st.subheader(f"Timeline for {project_name}")
-            for phase in timeline:
+            removed = store.save_timeline(project_name, timeline)
+            if removed:
+                st.warning(f"The new timeline no longer has some phases, so {removed} milestone(s) of those phases were deleted.")
+            st.session_state.timeline_project = project_name
+
+    # The current plan is reloaded from the store on every rerun, milestones included
+    current_project = st.session_state.get('timeline_project')
+    if current_project:
+        plan = store.load_plan(current_project)
+        st.subheader(f"Timeline for {current_project}")
+        if 'milestone_notice' in st.session_state:
+            st.success(st.session_state.pop('milestone_notice'))
+        with st.form("milestone_form", clear_on_submit=True):
+            for phase in plan:
                 with st.expander(f"{phase['phase']} ({phase['start_date'].strftime('%Y-%m-%d')} to {phase['end_date'].strftime('%Y-%m-%d')})"):
                     st.write(f"**Description:** {phase['description']}")
                     st.write(f"**Relevant SDGs:** {', '.join(phase['sdgs'])}")
-                    
+                    for milestone in phase['milestones']:
+                        st.write(f"- {milestone}")
+
                     # Suggest a milestone
-                    milestone = st.text_input("Add a milestone for this phase:", key=phase['phase'])
-                    if milestone:
-                        st.success(f"Milestone added: {milestone}")
-    
+                    st.text_input("Add a milestone for this phase:", key=f"milestone-{current_project}-{phase['phase_number']}")
+
+            if st.form_submit_button("Save Milestones"):
+                # All milestones typed in this form are written in one transaction
+                saved_count = store.add_milestones(
+                    (current_project, phase['phase_number'],
+                     st.session_state.get(f"milestone-{current_project}-{phase['phase_number']}", ""))
+                    for phase in plan
+                )
+                st.session_state.milestone_notice = f"Saved {saved_count} milestone(s)."
+                st.rerun()
+
+    # Timelines for a whole portfolio at once
+    with st.expander("📦 Portfolio Timelines"):
+        st.write(f"Upload a CSV or Parquet file with the columns: {', '.join(PROJECT_COLUMNS)}. "
+                 "Separate multiple SDGs with semicolons; names, 'SDG 3' or plain numbers all work.")
+        portfolio_file = st.file_uploader("Project portfolio", type=['csv', 'parquet'])
+        if portfolio_file is not None and st.button("Generate Portfolio Timelines"):
+            try:
+                projects, errors = validate_projects(read_projects(portfolio_file))
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.session_state.portfolio_timelines = generate_timelines(projects)
+                st.session_state.portfolio_index = PhaseIndex(st.session_state.portfolio_timelines)
+                if not errors.empty:
+                    st.warning(f"Skipped {len(errors):,} invalid rows.")
+                    st.dataframe(errors, hide_index=True)
+
+        timelines = st.session_state.get('portfolio_timelines')
+        if timelines is not None:
+            st.write(f"{timelines['Project'].nunique():,} projects, {len(timelines):,} phases.")
+            st.dataframe(timelines, hide_index=True)
+
+            def export(file_format):
+                buffer = BytesIO() if file_format == "parquet" else StringIO()
+                write_timelines(timelines, buffer, file_format)
+                return buffer.getvalue()
+
+            col1, col2, col3 = st.columns(3)
+            col1.download_button("Download as CSV", data=lambda: export("csv"),
+                                 file_name="portfolio_timelines.csv", mime="text/csv")
+            col2.download_button("Download as iCalendar", data=lambda: export("ics"),
+                                 file_name="portfolio_timelines.ics", mime="text/calendar")
+            col3.download_button("Download as Parquet", data=lambda: export("parquet"),
+                                 file_name="portfolio_timelines.parquet", mime="application/octet-stream")
+
+            if st.button("Save Portfolio Plans"):
+                removed = get_milestone_store().save_timelines(timelines)
+                st.success(f"Saved {timelines['Project'].nunique():,} project plans. Open any of them above to add milestones.")
+                if removed:
+                    st.warning(f"{removed:,} milestone(s) belonged to phases the new plans no longer have and were deleted.")
+
+            # Portfolio-wide overlap, load and Gantt views, all answered from the phase index
+            if len(timelines):
+                index = st.session_state.portfolio_index
+                st.subheader("Portfolio Load")
+                week_of = st.date_input("Show phases active in the week of", index.starts[0].item(), key="portfolio_week")
+                year, week, _ = week_of.isocalendar()
+                active = index.active_in_week(year, week)
+                st.write(f"{len(active):,} phases active in week {week} of {year}.")
+                st.dataframe(active, hide_index=True)
+
+                load = index.monthly_load()
+                if load.empty:
+                    st.info("None of these phases has an SDG, so there is no load to show.")
+                else:
+                    fig_load = px.imshow(load.T, aspect="auto", labels={"x": "Month", "y": "SDG", "color": "Active Phases"},
+                                         title="Concurrent Phases per SDG per Month")
+                    st.plotly_chart(fig_load)
+                    capacity = st.number_input("Flag months with more active phases per SDG than", min_value=0,
+                                               value=int(load.to_numpy().mean() * 1.5))
+                    overloaded = overloaded_months(load, capacity)
+                    if overloaded.empty:
+                        st.success("No SDG exceeds that load in any month.")
+                    else:
+                        st.warning(f"{len(overloaded):,} SDG-months exceed {capacity} concurrent phases.")
+                        st.dataframe(overloaded, hide_index=True)
+                    st.dataframe(index.peak_concurrency())
+
+                window = st.date_input("Gantt window", (week_of, week_of + timedelta(days=90)), key="gantt_window")
+                if len(window) == 2:
+                    fig_gantt, truncated = gantt_figure(index, window[0], window[1])
+                    if truncated:
+                        st.info("Showing the first phases only; narrow the window to see them all.")
+                    st.plotly_chart(fig_gantt)
+            else:
+                st.info("No valid project rows, so there is no portfolio load to show.")
+
     # About the tool
     with st.expander("ℹ️ About this tool"):
         st.write("This tool helps you create a basic timeline for your SDG-aligned project.")
@@ -1,30 +1,26 @@
+import os
+import numpy as np
 import streamlit as st
-import pandas as pd
 import plotly.express as px
+from io import BytesIO, StringIO
+from activity_store import ActivityStore, COLUMNS, read_activities, validate_activities, summarize_activities, write_plan
+from allocation_solver import solve_allocation
+from scenario_sweep import grid_values, run_scenarios, impact_grid
 
-def create_resource_df():
-    return pd.DataFrame(columns=["Activity", "SDG", "Budget", "Time", "Personnel", "Impact Score"])
+def create_resource_store():
+    return ActivityStore()
 
-def add_activity(df, activity, sdg, budget, time, personnel, impact):
-    new_row = pd.DataFrame({
-        "Activity": [activity],
-        "SDG": [sdg],
-        "Budget": [budget],
-        "Time": [time],
-        "Personnel": [personnel],
-        "Impact Score": [impact]
-    })
-    return pd.concat([df, new_row], ignore_index=True)
-
-def calculate_efficiency(row):
-    return row['Impact Score'] / (row['Budget'] + row['Time'] + row['Personnel'])
+def add_activity(store, activity, sdg, budget, time, personnel, impact):
+    store.append(activity, sdg, budget, time, personnel, impact)
+    return store
 
 def main():
     st.title("🎯 Resource Allocation Optimizer")
     st.write("Optimize your resource allocation for maximum impact across SDG-aligned project activities.")
 
-    if 'resource_df' not in st.session_state:
-        st.session_state.resource_df = create_resource_df()
+    if 'resource_store' not in st.session_state:
+        st.session_state.resource_store = create_resource_store()
+    store = st.session_state.resource_store
 
     total_budget = st.sidebar.number_input("Total Budget Available", min_value=0, value=100000)
     total_time = st.sidebar.number_input("Total Time Available (person-months)", min_value=0, value=24)
@@ -44,37 +40,120 @@ def main():
 
         if submit_button:
             if activity and sdg and budget >= 0 and time >= 0 and personnel >= 0:
-                st.session_state.resource_df = add_activity(
-                    st.session_state.resource_df,
-                    activity, sdg, budget, time, personnel, impact
-                )
+                add_activity(store, activity, sdg, budget, time, personnel, impact)
                 st.success(f"Added {activity} to the project activities.")
             else:
                 st.warning("Please fill in all fields with valid values.")
 
+    # Bulk import of a whole activity portfolio
+    with st.expander("📥 Bulk Import Activities"):
+        st.write(f"Upload a CSV or Parquet file with the columns: {', '.join(COLUMNS)}.")
+        portfolio_file = st.file_uploader("Activity portfolio", type=['csv', 'parquet'])
+        if portfolio_file is not None and st.button("Import Activities"):
+            try:
+                valid_df, errors = validate_activities(read_activities(portfolio_file))
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if not valid_df.empty:
+                    store.extend(valid_df)
+                    _, totals, by_sdg = summarize_activities(valid_df)
+                    st.success(f"Imported {len(valid_df):,} activities "
+                               f"(budget {totals['Budget']:,.0f}, time {totals['Time']:,.1f} months, "
+                               f"personnel {totals['Personnel']:,.0f}).")
+                    st.dataframe(by_sdg)
+                if not errors.empty:
+                    st.warning(f"Skipped {len(errors):,} invalid rows.")
+                    st.dataframe(errors, hide_index=True)
+
     # Display and analyze activities
-    if not st.session_state.resource_df.empty:
+    if not store.empty:
         st.subheader("Project Activities and Resource Allocation")
         
-        # Calculate efficiency scores
-        st.session_state.resource_df['Efficiency'] = st.session_state.resource_df.apply(calculate_efficiency, axis=1)
+        # Efficiency scores are computed (vectorized) when the store's frame is rebuilt
+        resource_df = store.to_frame()
         
         # Sort by efficiency
-        sorted_df = st.session_state.resource_df.sort_values('Efficiency', ascending=False)
+        sorted_df = resource_df.sort_values('Efficiency', ascending=False)
         
         st.dataframe(sorted_df)
 
         # Resource usage summary
         st.subheader("Resource Usage Summary")
-        total_used_budget = sorted_df['Budget'].sum()
-        total_used_time = sorted_df['Time'].sum()
-        total_used_personnel = sorted_df['Personnel'].sum()
+        total_used_budget = store.totals['Budget']
+        total_used_time = store.totals['Time']
+        total_used_personnel = store.totals['Personnel']
 
         col1, col2, col3 = st.columns(3)
         col1.metric("Budget Used", f"{total_used_budget:,.0f}", f"{total_used_budget/total_budget:.1%}")
         col2.metric("Time Used", f"{total_used_time:.1f} months", f"{total_used_time/total_time:.1%}")
         col3.metric("Personnel Used", total_used_personnel, f"{total_used_personnel/total_personnel:.1%}")
 
+        # Constrained optimization: best set of activities within the available resources
+        st.subheader("Optimal Activity Selection")
+        st.write("Pick the combination of activities with the highest total impact that fits the budget, time and personnel available.")
+        solver_mode = st.radio("Solver", ["Auto", "Exact (MILP)", "Fast heuristic"], horizontal=True,
+                               help="Auto solves exactly for small portfolios and switches to greedy + local search for large ones.")
+        time_limit = st.slider("Solver time limit (seconds)", 1, 60, 5)
+        if st.button("Find Best Activity Set"):
+            method = {"Auto": "auto", "Exact (MILP)": "exact", "Fast heuristic": "heuristic"}[solver_mode]
+            result = solve_allocation(resource_df, total_budget, total_time, total_personnel,
+                                      method=method, time_limit=time_limit)
+            selected_df = resource_df[result["selected"]].sort_values('Efficiency', ascending=False)
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total Impact", f"{result['impact']:,.0f}", f"of {sorted_df['Impact Score'].sum():,.0f} possible")
+            if result["optimal"]:
+                gap_label = "0% (proven optimal)"
+            elif not np.isnan(result["gap"]):
+                gap_label = f"{result['gap']:.1%} (solver)"
+            else:
+                gap_label = f"≤ {result['gap_bound']:.1%} (LP bound)"
+            col2.metric("Optimality Gap", gap_label)
+            col3.metric("Solve Time", f"{result['solve_time']:.2f} s", result["method"])
+            st.write(f"Selected {len(selected_df)} of {len(resource_df)} activities, using "
+                     f"{result['used']['Budget']:,.0f} budget, {result['used']['Time']:.1f} months and "
+                     f"{result['used']['Personnel']:,.0f} personnel.")
+            st.dataframe(selected_df)
+
+        # Scenario sweep: achievable impact across a grid of resource limits
+        with st.expander("📊 Scenario Analysis"):
+            st.write("Evaluate the best achievable impact for every combination of budget, time and personnel limits.")
+            ranges = {}
+            for label, name, current in [("Budget", "Budget", total_budget), ("Time (person-months)", "Time", total_time),
+                                         ("Personnel", "Personnel", total_personnel)]:
+                col1, col2, col3 = st.columns(3)
+                low = col1.number_input(f"{label} from", min_value=0.0, value=float(current) * 0.5, key=f"sweep_{name}_low")
+                high = col2.number_input(f"{label} to", min_value=0.0, value=float(current) * 1.5, key=f"sweep_{name}_high")
+                steps = col3.number_input(f"{label} steps", min_value=1, max_value=25, value=5 if name != "Personnel" else 3,
+                                          key=f"sweep_{name}_steps")
+                ranges[name] = grid_values(low, high, int(steps))
+            sweep_solver = st.radio("Scenario solver", ["Fast heuristic", "Exact (MILP)"], horizontal=True)
+            workers = st.number_input("Worker processes", min_value=1, max_value=max(1, os.cpu_count() or 1),
+                                      value=max(1, os.cpu_count() or 1))
+            if st.button("Run Scenarios"):
+                with st.spinner(f"Evaluating {len(ranges['Budget']) * len(ranges['Time']) * len(ranges['Personnel'])} scenarios..."):
+                    st.session_state.scenario_results = run_scenarios(
+                        resource_df, ranges["Budget"], ranges["Time"], ranges["Personnel"],
+                        method="heuristic" if sweep_solver == "Fast heuristic" else "exact",
+                        time_limit=1.0, workers=workers
+                    )
+
+            results = st.session_state.get('scenario_results')
+            if results is not None:
+                st.dataframe(results, hide_index=True)
+                personnel_level = st.selectbox("Personnel level for heatmap", sorted(results["Personnel"].unique()))
+                fig_sweep = px.imshow(impact_grid(results, personnel_level), text_auto=True, aspect="auto",
+                                      labels={"x": "Budget", "y": "Time", "color": "Impact"},
+                                      title=f"Achievable Impact (Personnel = {personnel_level})")
+                st.plotly_chart(fig_sweep)
+                st.download_button(
+                    label="Download Scenario Results as CSV",
+                    data=results.to_csv(index=False),
+                    file_name="resource_allocation_scenarios.csv",
+                    mime="text/csv",
+                )
+
         # Visualizations
         st.subheader("Resource Allocation Visualizations")
         
@@ -88,14 +167,30 @@ def main():
                                 title='Impact vs Efficiency of Activities')
         st.plotly_chart(fig_impact)
 
-        # Option to download as CSV
-        csv = sorted_df.to_csv(index=False)
-        st.download_button(
+        # Option to download as CSV or Parquet; the file is written in chunks when the button is clicked
+        def plan_csv():
+            buffer = StringIO()
+            write_plan(sorted_df, buffer)
+            return buffer.getvalue()
+
+        def plan_parquet():
+            buffer = BytesIO()
+            write_plan(sorted_df, buffer, file_format="parquet")
+            return buffer.getvalue()
+
+        col1, col2 = st.columns(2)
+        col1.download_button(
             label="Download Resource Allocation Plan as CSV",
-            data=csv,
+            data=plan_csv,
             file_name="resource_allocation_plan.csv",
             mime="text/csv",
         )
+        col2.download_button(
+            label="Download Resource Allocation Plan as Parquet",
+            data=plan_parquet,
+            file_name="resource_allocation_plan.parquet",
+            mime="application/octet-stream",
+        )
     else:
         st.info("No activities added yet. Use the form above to add activities to your project.")
 
@@ -1,86 +1,103 @@
 import streamlit as st
-import pandas as pd
+import plotly.express as px
+from stakeholder_store import (StakeholderStore, COLUMNS, STAKEHOLDER_CATEGORIES, ENGAGEMENT_STRATEGIES,
+                               read_stakeholders, validate_stakeholders)
+from stakeholder_priority import QUADRANTS, prioritize_stakeholders, category_summary, quadrant_counts
 
 def get_stakeholder_categories():
-    return [
-        "Government agencies",
-        "Local communities",
-        "NGOs and civil society organizations",
-        "Donors and funders",
-        "Private sector companies",
-        "Academic institutions",
-        "Media",
-        "Beneficiaries",
-        "Project team members",
-        "Other"
-    ]
+    return list(STAKEHOLDER_CATEGORIES)
 
 def get_engagement_strategies():
-    return [
-        "Regular meetings",
-        "Workshops and seminars",
-        "Surveys and feedback forms",
-        "Newsletters and reports",
-        "Social media engagement",
-        "Community events",
-        "Focus group discussions",
-        "Advisory committees",
-        "Partnerships and collaborations",
-        "Other"
-    ]
-
-def create_stakeholder_df():
-    return pd.DataFrame(columns=["Stakeholder", "Category", "Interest/Influence", "Engagement Strategy"])
-
-def add_stakeholder(df, stakeholder, category, interest_influence, strategy):
-    new_row = pd.DataFrame({
-        "Stakeholder": [stakeholder],
-        "Category": [category],
-        "Interest/Influence": [interest_influence],
-        "Engagement Strategy": [strategy]
-    })
-    return pd.concat([df, new_row], ignore_index=True)
+    return list(ENGAGEMENT_STRATEGIES)
+
+def create_stakeholder_store():
+    return StakeholderStore()
+
+def add_stakeholder(store, stakeholder, category, interest, influence, strategy):
+    _, added = store.append(stakeholder, category, interest, influence, strategy)
+    return added
 
 def main():
     st.title("🤝 Stakeholder Engagement Planner")
     st.write("Identify and plan engagement with key stakeholders for your SDG-aligned project.")
 
-    if 'stakeholder_df' not in st.session_state:
-        st.session_state.stakeholder_df = create_stakeholder_df()
+    if 'stakeholder_store' not in st.session_state:
+        st.session_state.stakeholder_store = create_stakeholder_store()
+    store = st.session_state.stakeholder_store
 
     # Input form for adding a stakeholder
     with st.form("add_stakeholder_form"):
         st.subheader("Add a Stakeholder")
         stakeholder = st.text_input("Stakeholder Name/Group")
         category = st.selectbox("Stakeholder Category", get_stakeholder_categories())
-        interest_influence = st.slider("Interest/Influence Level", 1, 10, 5)
+        interest = st.slider("Interest Level", 1, 10, 5)
+        influence = st.slider("Influence Level", 1, 10, 5)
         strategy = st.multiselect("Engagement Strategy", get_engagement_strategies())
 
         submit_button = st.form_submit_button("Add Stakeholder")
 
         if submit_button:
             if stakeholder and category and strategy:
-                st.session_state.stakeholder_df = add_stakeholder(
-                    st.session_state.stakeholder_df,
-                    stakeholder,
-                    category,
-                    interest_influence,
-                    ", ".join(strategy)
-                )
-                st.success(f"Added {stakeholder} to the stakeholder list.")
+                if add_stakeholder(store, stakeholder, category, interest, influence, strategy):
+                    st.success(f"Added {stakeholder} to the stakeholder list.")
+                else:
+                    st.warning(f"{stakeholder} is already listed under {category}.")
             else:
                 st.warning("Please fill in all fields.")
 
+    # Bulk import of a whole stakeholder list
+    with st.expander("📥 Bulk Import Stakeholders"):
+        st.write(f"Upload a CSV or Parquet file with the columns: {', '.join(COLUMNS)}. "
+                 "Separate multiple engagement strategies with commas.")
+        stakeholder_file = st.file_uploader("Stakeholder list", type=['csv', 'parquet'])
+        if stakeholder_file is not None and st.button("Import Stakeholders"):
+            try:
+                valid_df, errors = validate_stakeholders(read_stakeholders(stakeholder_file))
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                skipped = store.extend(valid_df)
+                st.success(f"Imported {len(valid_df) - skipped:,} stakeholders.")
+                if skipped:
+                    st.info(f"Skipped {skipped:,} duplicates already in the list.")
+                if not errors.empty:
+                    st.warning(f"Skipped {len(errors):,} invalid rows.")
+                    st.dataframe(errors, hide_index=True)
+
     # Display stakeholder table
-    if not st.session_state.stakeholder_df.empty:
+    if not store.empty:
         st.subheader("Stakeholder Engagement Plan")
-        st.dataframe(st.session_state.stakeholder_df)
+        col1, col2, col3 = st.columns(3)
+        name_filter = col1.text_input("Find stakeholder by name")
+        category_filter = col2.multiselect("Filter by category", get_stakeholder_categories())
+        strategy_filter = col3.multiselect("Filter by strategy", get_engagement_strategies())
+        # Quadrant, percentile and intensity are computed for the whole registry in one vectorized pass
+        prioritized_df = prioritize_stakeholders(store.to_frame())
+        if name_filter or category_filter or strategy_filter:
+            filtered_df = prioritized_df.iloc[store.select_ids(name_filter, category_filter, strategy_filter)]
+        else:
+            filtered_df = prioritized_df
+        st.write(f"Showing {len(filtered_df):,} of {len(store):,} stakeholders.")
+        st.dataframe(filtered_df)
+
+        st.subheader("Prioritization by Category")
+        st.dataframe(category_summary(prioritized_df))
+        fig_quadrants = px.bar(quadrant_counts(prioritized_df), x="Category", y="Stakeholders", color="Quadrant",
+                               category_orders={"Quadrant": QUADRANTS}, title="Stakeholders per Category and Quadrant")
+        st.plotly_chart(fig_quadrants)
+        # Binned counts keep the power/interest map the same size however many stakeholders there are
+        fig_map = px.density_heatmap(prioritized_df, x="Interest", y="Influence", nbinsx=10, nbinsy=10,
+                                     range_x=[0.5, 10.5], range_y=[0.5, 10.5], text_auto=True,
+                                     title="Power/Interest Map")
+        st.plotly_chart(fig_map)
+
+        _, by_strategy = store.counts()
+        st.dataframe(by_strategy[by_strategy > 0])
 
         # Option to download as CSV
-        csv = st.session_state.stakeholder_df.to_csv(index=False)
         st.download_button(
             label="Download Stakeholder Plan as CSV",
-            data=csv,
+            data=lambda: prioritize_stakeholders(store.to_frame()).to_csv(index=False),
             file_name="stakeholder_engagement_plan.csv",
             mime="text/csv",
         )
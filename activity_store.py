@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+# Append-only columnar store for Resource Allocation Optimizer activities.
+#
+# Each column is a plain Python list, so adding an activity is an amortized O(1)
+# append instead of a pd.concat copy of the whole table. Resource totals are kept
+# up to date on every append, and the DataFrame view (with the vectorized
+# Efficiency column) is built only when it is asked for and reused until the next
+# change.
+
+COLUMNS = ["Activity", "SDG", "Budget", "Time", "Personnel", "Impact Score"]
+RESOURCE_COLUMNS = ["Budget", "Time", "Personnel"]
+NUMERIC_COLUMNS = RESOURCE_COLUMNS + ["Impact Score"]
+VALID_SDGS = [f"SDG {i}" for i in range(1, 18)]
+PLAN_CHUNK_ROWS = 50_000
+
+
+# Function to read an activity portfolio from a CSV or Parquet file (path or upload)
+def read_activities(source, name=None):
+    name = (name or getattr(source, "name", None) or str(source)).lower()
+    if name.endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+# Function to check a whole portfolio at once; returns (valid rows, table of rejected rows with reasons)
+def validate_activities(df):
+    missing = [name for name in COLUMNS if name not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    df = df[COLUMNS].copy()
+    df["Activity"] = df["Activity"].astype("string").str.strip()
+    df["SDG"] = df["SDG"].astype("string").str.strip()
+    for name in NUMERIC_COLUMNS:
+        df[name] = pd.to_numeric(df[name], errors="coerce")
+
+    checks = {
+        "missing activity name": df["Activity"].fillna("").eq(""),
+        "unknown SDG": ~df["SDG"].isin(VALID_SDGS).fillna(False).astype(bool),
+        "non-numeric or missing resource": df[NUMERIC_COLUMNS].isna().any(axis=1),
+        "negative resource": (df[RESOURCE_COLUMNS] < 0).any(axis=1),
+        "impact score outside 1-10": ~df["Impact Score"].between(1, 10),
+    }
+    reasons = pd.Series("", index=df.index)
+    for reason, failed in checks.items():
+        reasons = reasons + failed.map({True: reason + "; ", False: ""})
+    invalid = reasons != ""
+
+    errors = pd.DataFrame({"Row": df.index[invalid] + 1, "Problem": reasons[invalid].str.rstrip("; ")})
+    valid = df[~invalid].reset_index(drop=True)
+    valid["Activity"] = valid["Activity"].astype(object)
+    valid["SDG"] = valid["SDG"].astype(object)
+    return valid, errors
+
+
+# Function to compute efficiencies and resource-usage totals for a portfolio in one pass
+def summarize_activities(df):
+    df = df.copy()
+    df["Efficiency"] = calculate_efficiencies(df)
+    totals = df[NUMERIC_COLUMNS].sum()
+    by_sdg = df.groupby("SDG", sort=True)[NUMERIC_COLUMNS].sum()
+    return df, totals, by_sdg
+
+
+# Function to write an allocation plan to CSV or Parquet chunk by chunk
+def write_plan(df, target, file_format="csv", chunk_size=PLAN_CHUNK_ROWS):
+    if file_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        schema = pa.Schema.from_pandas(df.head(chunk_size), preserve_index=False)
+        with pq.ParquetWriter(target, schema) as writer:
+            for start in range(0, len(df), chunk_size):
+                writer.write_table(pa.Table.from_pandas(df.iloc[start:start + chunk_size], schema=schema, preserve_index=False))
+        return
+    close = isinstance(target, str)
+    handle = open(target, "w", newline="", encoding="utf-8") if close else target
+    try:
+        for start in range(0, max(len(df), 1), chunk_size):
+            handle.write(df.iloc[start:start + chunk_size].to_csv(index=False, header=start == 0))
+    finally:
+        if close:
+            handle.close()
+
+
+# Function to compute Impact Score / (Budget + Time + Personnel) for every row at once
+def calculate_efficiencies(df):
+    resources = df[RESOURCE_COLUMNS].to_numpy(dtype="float64").sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.Series(df["Impact Score"].to_numpy(dtype="float64") / resources, index=df.index, name="Efficiency")
+
+
+class ActivityStore:
+    def __init__(self):
+        self.columns = {name: [] for name in COLUMNS}
+        self.totals = {name: 0 for name in RESOURCE_COLUMNS + ["Impact Score"]}
+        self._frame = None
+
+    def __len__(self):
+        return len(self.columns["Activity"])
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def append(self, activity, sdg, budget, time, personnel, impact):
+        row = {"Activity": activity, "SDG": sdg, "Budget": budget, "Time": time,
+               "Personnel": personnel, "Impact Score": impact}
+        for name in COLUMNS:
+            self.columns[name].append(row[name])
+        for name in self.totals:
+            self.totals[name] += row[name]
+        self._frame = None
+
+    # Function to append many activities from a DataFrame with the store's columns
+    def extend(self, df):
+        for name in COLUMNS:
+            self.columns[name].extend(df[name].tolist())
+        for name in self.totals:
+            self.totals[name] += df[name].sum()
+        self._frame = None
+
+    # Function to build (or reuse) the DataFrame view, including the Efficiency column
+    def to_frame(self):
+        if self._frame is None:
+            frame = pd.DataFrame(self.columns, columns=COLUMNS)
+            frame["Efficiency"] = calculate_efficiencies(frame)
+            self._frame = frame
+        return self._frame
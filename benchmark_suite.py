@@ -0,0 +1,366 @@
+import argparse
+import datetime
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+# Headless benchmarks for the toolkit's hot paths.
+#
+# Usage:
+#   python benchmark_suite.py                      # every benchmark at the small and medium sizes
+#   python benchmark_suite.py --sizes large -k match --repeat 10
+#   python benchmark_suite.py --fail-on-regression # exit 1 if anything got slower than the last run
+#
+# Every benchmark builds a seeded synthetic corpus for each size, times the call
+# `repeat` times with a fresh setup each time (setup is not timed), and records
+# the min/median/mean. Runs are appended to a JSON history together with the git
+# commit, so the report can show how each benchmark moved since the previous run.
+
+DEFAULT_HISTORY = "benchmark_history.json"
+DEFAULT_SIZES = ("small", "medium")
+SIZE_SCALES = {"small": 1, "medium": 10, "large": 100}
+REGRESSION_THRESHOLD = 0.20
+SEED = 0
+
+BENCHMARKS = {}
+
+
+# Function to register a benchmark; base is the workload size at scale "small"
+def benchmark(name, base):
+    def register(setup):
+        BENCHMARKS[name] = (setup, base)
+        return setup
+    return register
+
+
+class NamedBytesIO(io.BytesIO):
+    # Stands in for Streamlit's UploadedFile, which is a BytesIO with a name
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
+
+def _vocabulary():
+    from sdg_toolkit.registry import SDG_DATA
+    words = []
+    for data in SDG_DATA.values():
+        words.extend(data["keywords"])
+        words.extend(data["description"].lower().rstrip(".").split())
+    return words + ["project", "community", "local", "partners", "program", "support", "the", "and", "with"] * 10
+
+
+def synthetic_descriptions(count, words_per_doc=120, seed=SEED):
+    rng = random.Random(seed)
+    words = _vocabulary()
+    return [" ".join(rng.choices(words, k=words_per_doc)) for _ in range(count)]
+
+
+def synthetic_frame(rows, seed=SEED):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Beneficiaries": rng.integers(0, 10_000, rows),
+        "Budget": rng.normal(50_000, 15_000, rows).round(2),
+        "Outcome Score": rng.uniform(0, 10, rows).round(3),
+        "Region": rng.choice(["North", "South", "East", "West"], rows),
+        "Program": rng.choice([f"Program {i}" for i in range(12)], rows),
+    })
+
+
+# Function to build a minimal text PDF with one line of text per page, without any PDF library
+def synthetic_pdf(pages, seed=SEED):
+    texts = synthetic_descriptions(pages, words_per_doc=40, seed=seed)
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in texts:
+        stream = f"BT /F1 10 Tf 40 750 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+                       b"/Contents %d 0 R >>" % len(objects))
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join(f"{kid} 0 R" for kid in kids).encode(), len(kids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+# Function to build a minimal DOCX (one paragraph per description) with just the zip and XML parts Word needs
+def synthetic_docx(paragraphs, seed=SEED):
+    body = "".join(f"<w:p><w:r><w:t>{escape(text)}</w:t></w:r></w:p>"
+                   for text in synthetic_descriptions(paragraphs, seed=seed))
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml",
+                         '<?xml version="1.0" encoding="UTF-8"?>'
+                         '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                         '<Default Extension="xml" ContentType="application/xml"/>'
+                         '<Override PartName="/word/document.xml" '
+                         'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                         '</Types>')
+        archive.writestr("_rels/.rels",
+                         '<?xml version="1.0" encoding="UTF-8"?>'
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         '<Relationship Id="rId1" Target="word/document.xml" '
+                         'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+                         '</Relationships>')
+        archive.writestr("word/document.xml",
+                         '<?xml version="1.0" encoding="UTF-8"?>'
+                         '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                         f'<w:body>{body}</w:body></w:document>')
+    return out.getvalue()
+
+
+# Each registered setup takes a workload size and returns the zero-argument call to time
+
+@benchmark("match_sdgs[Cal_v2]", base=200)
+def bench_match_sdgs_v2(size):
+    import Cal_v2
+    from sdg_toolkit.registry import get_sdg_data
+    sdg_data, docs = get_sdg_data(), synthetic_descriptions(size)
+    return lambda: [Cal_v2.match_sdgs(doc, sdg_data) for doc in docs]
+
+
+@benchmark("match_sdgs[Cal_v3]", base=200)
+def bench_match_sdgs_v3(size):
+    import Cal_v3
+    from sdg_toolkit.registry import get_sdg_data
+    sdg_data, docs = get_sdg_data(), synthetic_descriptions(size)
+    return lambda: [Cal_v3.match_sdgs(doc, sdg_data) for doc in docs]
+
+
+@benchmark("provide_feedback", base=100)
+def bench_provide_feedback(size):
+    import Cal_v3
+    import streamlit as st
+    from sdg_toolkit.registry import get_sdg_data
+    sdg_data = get_sdg_data()
+    # Simulates typing: each rerun sees the previous text plus one more word
+    words = synthetic_descriptions(1, words_per_doc=size)[0].split()
+    texts = [" ".join(words[:i]) for i in range(1, len(words) + 1)]
+    st.session_state.pop('feedback_state', None)
+    return lambda: [Cal_v3.provide_feedback(text, sdg_data) for text in texts]
+
+
+@benchmark("load_data[csv]", base=5_000)
+def bench_load_csv(size):
+    from Impact_Calculator_Report_Generator_v1 import load_data
+    data = synthetic_frame(size).to_csv(index=False).encode("utf-8")
+    return lambda: load_data(NamedBytesIO(data, "impact.csv"))
+
+
+@benchmark("load_data[pdf]", base=10)
+def bench_load_pdf(size):
+    from Impact_Calculator_Report_Generator_v1 import load_data
+    data = synthetic_pdf(size)
+    return lambda: load_data(NamedBytesIO(data, "impact.pdf"))
+
+
+@benchmark("load_data[docx]", base=200)
+def bench_load_docx(size):
+    from Impact_Calculator_Report_Generator_v1 import load_data
+    data = synthetic_docx(size)
+    return lambda: load_data(NamedBytesIO(data, "impact.docx"))
+
+
+@benchmark("calculate_impact", base=10_000)
+def bench_calculate_impact(size):
+    from Impact_Calculator_Report_Generator_v1 import calculate_impact
+    df = synthetic_frame(size)
+    return lambda: calculate_impact(df)
+
+
+@benchmark("generate_visualizations", base=2_000)
+def bench_generate_visualizations(size):
+    from Impact_Calculator_Report_Generator_v1 import generate_visualizations
+    df = synthetic_frame(size)
+    return lambda: generate_visualizations(df)
+
+
+@benchmark("add_activity[growth]", base=1_000)
+def bench_add_activity(size):
+    from Resolurce_Allocation_Optimizer_v1 import add_activity, create_resource_store
+    rng = random.Random(SEED)
+    rows = [(f"Activity {i}", f"SDG {rng.randint(1, 17)}", rng.randint(0, 50_000), rng.randint(0, 24),
+             rng.randint(0, 10), rng.randint(1, 10)) for i in range(size)]
+
+    def run():
+        store = create_resource_store()
+        for row in rows:
+            add_activity(store, *row)
+        return store.to_frame()
+    return run
+
+
+@benchmark("add_stakeholder[growth]", base=1_000)
+def bench_add_stakeholder(size):
+    from Stakeholder_Engagement_Planner_V1 import (add_stakeholder, create_stakeholder_store,
+                                                   get_engagement_strategies, get_stakeholder_categories)
+    rng = random.Random(SEED)
+    categories, strategies = get_stakeholder_categories(), get_engagement_strategies()
+    rows = [(f"Stakeholder {i}", rng.choice(categories), rng.randint(1, 10), rng.randint(1, 10),
+             rng.sample(strategies, rng.randint(1, 3))) for i in range(size)]
+
+    def run():
+        store = create_stakeholder_store()
+        for row in rows:
+            add_stakeholder(store, *row)
+        return store.to_frame()
+    return run
+
+
+@benchmark("generate_timeline", base=500)
+def bench_generate_timeline(size):
+    from Project_Timeline_Generator_v1 import generate_timeline
+    from sdg_toolkit.registry import SDG_DATA
+    rng = random.Random(SEED)
+    names = list(SDG_DATA)
+    projects = [(f"Project {i}", datetime.date(2025, 1, 1) + datetime.timedelta(days=rng.randint(0, 365)),
+                 rng.randint(1, 36), rng.sample(names, rng.randint(1, 4))) for i in range(size)]
+    return lambda: [generate_timeline(*project) for project in projects]
+
+
+# Function to time one benchmark at one size
+def run_benchmark(name, size_name, repeat):
+    setup, base = BENCHMARKS[name]
+    size = base * SIZE_SCALES[size_name]
+    timings = []
+    for _ in range(repeat):
+        call = setup(size)
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return {
+        "size": size,
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_history(path, history):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(history, handle, indent=1)
+    os.replace(tmp_path, path)
+
+
+# Function to compare a run's medians with the most recent earlier run that measured the same benchmark
+def compare(results, history, threshold=REGRESSION_THRESHOLD):
+    rows = []
+    for key, result in results.items():
+        previous = next((run["results"][key] for run in reversed(history) if key in run["results"]), None)
+        change = (result["median"] / previous["median"] - 1) if previous and previous["median"] > 0 else None
+        rows.append({
+            "benchmark": key,
+            "size": result["size"],
+            "median_ms": result["median"] * 1000,
+            "previous_ms": previous["median"] * 1000 if previous else None,
+            "change": change,
+            "regression": change is not None and change > threshold,
+        })
+    return pd.DataFrame(rows)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the SDG toolkit's hot paths on synthetic data.")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help=f"Comma-separated sizes to run ({', '.join(SIZE_SCALES)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark and size")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON file the results are appended to")
+    parser.add_argument("--no-save", action="store_true", help="Report without appending to the history")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="Median slowdown (fraction) reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on any regression")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.list:
+        for name, (_, base) in BENCHMARKS.items():
+            print(f"{name} (small size {base})")
+        return 0
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZE_SCALES]
+    if unknown:
+        raise SystemExit(f"Unknown size(s): {', '.join(unknown)}")
+
+    # Streamlit functions called outside `streamlit run` log a warning per call
+    import streamlit  # noqa: F401 -- creates the loggers silenced below
+    for logger_name in list(logging.root.manager.loggerDict):
+        if logger_name.startswith("streamlit"):
+            logging.getLogger(logger_name).setLevel(logging.ERROR)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    results = {}
+    for name in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        for size_name in sizes:
+            key = f"{name}@{size_name}"
+            results[key] = run_benchmark(name, size_name, args.repeat)
+            print(f"{key:<40} {results[key]['median'] * 1000:10.2f} ms", file=sys.stderr)
+
+    history = load_history(args.history)
+    report = compare(results, history, args.threshold)
+    with pd.option_context("display.width", 140, "display.max_rows", None):
+        print(report.to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+
+    if not args.no_save:
+        history.append({
+            "commit": _git_commit(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        })
+        save_history(args.history, history)
+
+    regressions = report[report["regression"]] if not report.empty else report
+    if args.fail_on_regression and not regressions.empty:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
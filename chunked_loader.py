@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Out-of-core loading for large impact data uploads.
+#
+# A CSV is read in chunks and each chunk is folded into running totals, so only
+# one chunk is held in memory at a time. Totals are accumulated per column in
+# float64 from the chunk as read. A column that any chunk reads as non-numeric is
+# left out of the score and statistics altogether, since a full read_csv would
+# type it as object and calculate_impact would skip it. The rows that are kept (a
+# preview of the first rows and a uniform random sample for plotting) get compact
+# dtypes: categoricals for repetitive text, int32 where values fit and float32
+# where pandas can downcast.
+
+DEFAULT_CHUNK_SIZE = 100_000
+CATEGORY_MAX_RATIO = 0.5
+SAMPLE_ROWS = 10_000
+
+
+# Function to shrink a DataFrame's dtypes (categoricals, int32, float32)
+def optimize_dtypes(df, category_max_ratio=CATEGORY_MAX_RATIO):
+    df = df.copy()
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            info = np.iinfo(np.int32)
+            if series.empty or (series.min() >= info.min and series.max() <= info.max):
+                df[col] = series.astype(np.int32)
+        elif pd.api.types.is_float_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='float')
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if len(series) and series.nunique() / len(series) <= category_max_ratio:
+                df[col] = series.astype('category')
+    return df
+
+
+# Function to append rows to a frame, keeping categoricals whose categories differ between the two
+def _concat_rows(df, rows):
+    df, rows = df.copy(), rows.copy()
+    for col in df.columns.intersection(rows.columns):
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and isinstance(rows[col].dtype, pd.CategoricalDtype):
+            categories = union_categoricals([df[col], rows[col]], ignore_order=True).categories
+            df[col] = df[col].cat.set_categories(categories)
+            rows[col] = rows[col].cat.set_categories(categories)
+    return pd.concat([df, rows], ignore_index=True)
+
+
+class ChunkedSummary:
+    def __init__(self, sample_rows=SAMPLE_ROWS, preview_rows=5, seed=0):
+        self.sample_rows = sample_rows
+        self.preview_rows = preview_rows
+        self.rng = np.random.default_rng(seed)
+        self.row_count = 0
+        self.preview = None
+        self.sample = None
+        self._sample_keys = np.empty(0)
+        # Per numeric column: count, mean, M2 (sum of squared deviations), min, max
+        self.stats = {}
+        self._column_sums = {}
+        self._non_numeric = set()
+
+    @property
+    def impact_score(self):
+        return sum(self._column_sums.values(), 0.0)
+
+    # Function to fold one chunk into the running totals
+    def add_chunk(self, chunk):
+        self.row_count += len(chunk)
+
+        numeric = chunk.select_dtypes(include='number')
+        for col in chunk.columns.difference(numeric.columns):
+            self._non_numeric.add(col)
+            self._column_sums.pop(col, None)
+            self.stats.pop(col, None)
+        for col in numeric.columns:
+            if col in self._non_numeric:
+                continue
+            values = numeric[col].dropna().to_numpy(dtype='float64')
+            self._column_sums[col] = self._column_sums.get(col, 0.0) + float(values.sum())
+            if values.size:
+                self._merge_stats(col, values.size, values.mean(), ((values - values.mean()) ** 2).sum(), values.min(), values.max())
+            elif col not in self.stats:
+                self.stats[col] = [0, 0.0, 0.0, np.nan, np.nan]
+
+        chunk = optimize_dtypes(chunk)
+        if self.preview is None:
+            self.preview = chunk.head(self.preview_rows)
+
+        # Bottom-k sampling: keep the rows with the smallest random keys seen so far
+        keys = self.rng.random(len(chunk))
+        if len(self._sample_keys) >= self.sample_rows:
+            # Rows keyed above the current k-th smallest key can never enter the sample
+            candidate_rows = keys < self._sample_keys.max()
+            chunk, keys = chunk[candidate_rows], keys[candidate_rows]
+        candidates = chunk if self.sample is None else _concat_rows(self.sample, chunk)
+        all_keys = np.concatenate([self._sample_keys, keys])
+        keep = np.argsort(all_keys, kind='stable')[:self.sample_rows]
+        keep.sort()
+        # A column that is categorical in one chunk but not another comes out of the concat as object
+        self.sample = optimize_dtypes(candidates.iloc[keep].reset_index(drop=True))
+        self._sample_keys = all_keys[keep]
+
+    # Function to combine a chunk's moments with the running ones (Chan et al.)
+    def _merge_stats(self, col, n_b, mean_b, m2_b, min_b, max_b):
+        if col not in self.stats or self.stats[col][0] == 0:
+            self.stats[col] = [n_b, mean_b, m2_b, min_b, max_b]
+            return
+        n_a, mean_a, m2_a, min_a, max_a = self.stats[col]
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self.stats[col] = [
+            n,
+            mean_a + delta * n_b / n,
+            m2_a + m2_b + delta ** 2 * n_a * n_b / n,
+            min(min_a, min_b),
+            max(max_a, max_b)
+        ]
+
+    # Function to build a df.describe()-style table; quartiles are estimated from the row sample
+    def describe(self):
+        summary = {}
+        for col, (n, mean, m2, min_value, max_value) in self.stats.items():
+            sample = self.sample[col].dropna().astype('float64') if self.sample is not None else pd.Series(dtype='float64')
+            quartiles = sample.quantile([0.25, 0.5, 0.75]).tolist() if not sample.empty else [np.nan] * 3
+            summary[col] = [
+                float(n),
+                mean if n else np.nan,
+                np.sqrt(m2 / (n - 1)) if n > 1 else np.nan,
+                min_value,
+                *quartiles,
+                max_value
+            ]
+        return pd.DataFrame(summary, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+
+
+# Function to read a CSV chunk by chunk into a ChunkedSummary
+def summarize_csv(uploaded_file, chunk_size=DEFAULT_CHUNK_SIZE, sample_rows=SAMPLE_ROWS, on_chunk=None):
+    summary = ChunkedSummary(sample_rows=sample_rows)
+    for chunk in pd.read_csv(uploaded_file, chunksize=chunk_size):
+        summary.add_chunk(chunk)
+        if on_chunk is not None:
+            on_chunk(summary.row_count)
+    return summary
+
+
+# Function to summarize an already loaded DataFrame (e.g. an Excel sheet) the same way
+def summarize_dataframe(df, chunk_size=DEFAULT_CHUNK_SIZE, sample_rows=SAMPLE_ROWS):
+    summary = ChunkedSummary(sample_rows=sample_rows)
+    for start in range(0, len(df), chunk_size):
+        summary.add_chunk(df.iloc[start:start + chunk_size])
+    return summary
@@ -0,0 +1,144 @@
+import datetime
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from timeline_batch import SDG_SEPARATOR, parse_sdgs
+
+# Persistent timeline and milestone store for the Project Timeline Generator.
+#
+# Plans live in a local SQLite file opened in WAL mode, so the Streamlit script
+# thread can read while a save is being written. Every save (one project's
+# phases, a whole portfolio or a form full of milestones) is a single
+# transaction with executemany. Phases are keyed by (project, phase number), and
+# milestones by (project, phase name): names such as "Project Closure" survive
+# regenerating a plan with a different duration, phase numbers don't. Reloading a
+# plan with its milestones is one indexed join.
+
+DEFAULT_DB_PATH = "project_timelines.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS phases (
+    project TEXT NOT NULL,
+    phase_number INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    description TEXT NOT NULL,
+    sdgs TEXT NOT NULL,
+    PRIMARY KEY (project, phase_number)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS milestones (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    milestone TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS milestones_by_phase ON milestones (project, phase);
+"""
+
+_LOAD_PLAN = """
+SELECT p.phase_number, p.phase, p.start_date, p.end_date, p.description, p.sdgs, m.milestone
+FROM phases AS p
+LEFT JOIN milestones AS m ON m.project = p.project AND m.phase = p.phase
+WHERE p.project = ?
+ORDER BY p.phase_number, m.id
+"""
+
+_DELETE_ORPHANED_MILESTONES = """
+DELETE FROM milestones
+WHERE project = ? AND phase NOT IN (SELECT phase FROM phases WHERE project = ?)
+"""
+
+# Milestones are added by phase number, as the UI shows them, and stored under that phase's name
+_ADD_MILESTONE = """
+INSERT INTO milestones (project, phase, milestone, created_at)
+SELECT project, phase, ?, ? FROM phases WHERE project = ? AND phase_number = ?
+"""
+
+
+def _iso(value):
+    return pd.Timestamp(value).date().isoformat()
+
+
+class MilestoneStore:
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        # One connection shared by Streamlit's script threads; the lock serializes access to it
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _replace_phases(self, projects, rows):
+        keys = [(project,) for project in projects]
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM phases WHERE project = ?", keys)
+            self._connection.executemany("INSERT INTO phases VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            # A shorter plan has fewer implementation phases; only milestones of phases no longer in the plan go
+            orphaned = self._connection.executemany(_DELETE_ORPHANED_MILESTONES, [key * 2 for key in keys])
+        return orphaned.rowcount
+
+    # Function to save (or replace) one project's generate_timeline phases, returning the milestones removed
+    def save_timeline(self, project, timeline):
+        rows = [(project, number, phase["phase"], _iso(phase["start_date"]), _iso(phase["end_date"]),
+                 phase["description"], SDG_SEPARATOR.join(phase["sdgs"]))
+                for number, phase in enumerate(timeline, start=1)]
+        return self._replace_phases([project], rows)
+
+    # Function to save (or replace) every project in a batch phase table in one transaction, returning the milestones removed
+    def save_timelines(self, timelines):
+        starts = np.datetime_as_string(pd.to_datetime(timelines["Start Date"]).to_numpy(dtype="datetime64[D]")).tolist()
+        ends = np.datetime_as_string(pd.to_datetime(timelines["End Date"]).to_numpy(dtype="datetime64[D]")).tolist()
+        rows = list(zip(timelines["Project"], timelines["Phase Number"].astype(int).tolist(), timelines["Phase"],
+                        starts, ends, timelines["Description"], timelines["SDGs"]))
+        return self._replace_phases(timelines["Project"].unique().tolist(), rows)
+
+    # Function to add many milestones at once from (project, phase number, milestone) tuples
+    def add_milestones(self, milestones):
+        created_at = datetime.datetime.now().isoformat(timespec="seconds")
+        rows = [(text.strip(), created_at, project, int(number)) for project, number, text in milestones if text.strip()]
+        if not rows:
+            return 0
+        with self._lock, self._connection:
+            return self._connection.executemany(_ADD_MILESTONE, rows).rowcount
+
+    # Function to reload a saved plan as generate_timeline phase dicts, each with its milestones
+    def load_plan(self, project):
+        with self._lock:
+            rows = self._connection.execute(_LOAD_PLAN, (project,)).fetchall()
+        plan = []
+        for number, phase, start, end, description, sdgs, milestone in rows:
+            if not plan or plan[-1]["phase_number"] != number:
+                plan.append({
+                    "phase_number": number,
+                    "phase": phase,
+                    "start_date": datetime.date.fromisoformat(start),
+                    "end_date": datetime.date.fromisoformat(end),
+                    "description": description,
+                    "sdgs": [name for name in parse_sdgs(sdgs) if name is not None],
+                    "milestones": [],
+                })
+            if milestone is not None:
+                plan[-1]["milestones"].append(milestone)
+        return plan
+
+    # Function to list the saved projects
+    def list_projects(self):
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT DISTINCT project FROM phases ORDER BY project")]
+
+    # Function to delete a project's phases and milestones
+    def delete_project(self, project):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM milestones WHERE project = ?", (project,))
+            self._connection.execute("DELETE FROM phases WHERE project = ?", (project,))
@@ -0,0 +1,86 @@
+import numpy as np
+
+# Data reduction in front of the Impact Calculator charts.
+#
+# Above a configurable row count each chart gets a reduced frame instead of the
+# full upload: bar charts show binned means, scatter plots a decimated subset
+# (uniform random sample, or LTTB along the x axis) and sunbursts a pre-grouped
+# hierarchy. Below the thresholds the data is passed through unchanged.
+
+DEFAULT_LIMITS = {
+    "bar": 2_000,
+    "scatter": 5_000,
+    "scatter_3d": 3_000,
+    "sunburst": 5_000,
+}
+
+
+# Function to merge user-supplied limits over the defaults
+def resolve_limits(limits=None):
+    resolved = dict(DEFAULT_LIMITS)
+    if limits:
+        resolved.update({name: int(value) for name, value in limits.items() if value})
+    return resolved
+
+
+# Function to average consecutive rows into at most max_bins bars
+def bin_rows(df, columns, max_bins):
+    if len(df) <= max_bins:
+        return df[list(columns)], False
+    bins = np.arange(len(df)) * max_bins // len(df)
+    binned = df[list(columns)].groupby(bins).mean()
+    # Label each bin with the index of its first row so the x axis still reads as row position
+    binned.index = df.index[np.searchsorted(bins, binned.index)]
+    return binned, True
+
+
+# Function to draw a reproducible uniform random sample, keeping the original index
+def sample_rows(df, max_points, seed=0):
+    if len(df) <= max_points:
+        return df, False
+    return df.sample(n=max_points, random_state=seed).sort_index(), True
+
+
+# Function to pick the row positions kept by Largest-Triangle-Three-Buckets
+def lttb_indices(x, y, max_points):
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(min(n, max(max_points, 0)))
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[stop:next_stop].mean() if next_stop > stop else x[-1]
+        next_y = y[stop:next_stop].mean() if next_stop > stop else y[-1]
+        # Keep the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+# Function to decimate a frame for a scatter plot of x against y
+def decimate_rows(df, x, y, max_points, method="random", seed=0):
+    if len(df) <= max_points:
+        return df, False
+    if method == "lttb":
+        ordered = df.dropna(subset=[x, y]).sort_values(x, kind="stable")
+        keep = lttb_indices(ordered[x].to_numpy(dtype="float64"), ordered[y].to_numpy(dtype="float64"), max_points)
+        return ordered.iloc[keep], True
+    return sample_rows(df, max_points, seed)
+
+
+# Function to pre-group a sunburst hierarchy so the chart only sees one row per leaf
+def group_hierarchy(df, path, values=None, max_rows=None):
+    if max_rows is not None and len(df) <= max_rows:
+        return df, values, False
+    path = list(path)
+    if values is None:
+        grouped = df.groupby(path, observed=True).size().rename("count").reset_index()
+        return grouped, "count", True
+    grouped = df.groupby(path, observed=True)[values].sum().reset_index()
+    return grouped, values, True
@@ -0,0 +1,152 @@
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# Content-addressed result cache for the Impact Calculator.
+#
+# Entries are keyed by the SHA-256 of the uploaded file plus a stage name (and any
+# options that change the result), so a rerun that doesn't change the upload reuses
+# the parsed data, score, figures and report. The in-memory tier is an LRU bounded
+# by an estimated byte size; an optional on-disk tier keeps pickled entries across
+# restarts and is trimmed oldest-first to its own byte limit.
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+# Function to hash the contents of an uploaded file
+def content_hash(uploaded_file):
+    data = uploaded_file.getvalue() if hasattr(uploaded_file, 'getvalue') else uploaded_file.read()
+    return hashlib.sha256(data).hexdigest()
+
+
+# Function to roughly estimate how much memory a cached value holds
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(item) for item in value) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sum(estimate_size(item) for item in value.values()) + sys.getsizeof(value)
+    if hasattr(value, 'to_plotly_json'):
+        return len(value.to_json())
+    if hasattr(value, '__dict__'):
+        return estimate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+class ContentCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, disk_dir=None, disk_max_bytes=DEFAULT_DISK_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        name = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, name + '.pkl')
+
+    # Function to look up a key in memory, then on disk; returns (found, value)
+    def lookup(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                with open(path, 'rb') as handle:
+                    value = pickle.load(handle)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                os.utime(path)
+                self._store_in_memory(key, value)
+                with self._lock:
+                    self.hits += 1
+                return True, value
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        self._store_in_memory(key, value)
+        if self.disk_dir:
+            self._store_on_disk(key, value)
+
+    # Function to return the cached value for key, computing and storing it on a miss
+    def get_or_compute(self, key, compute):
+        found, value = self.lookup(key)
+        if not found:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _store_in_memory(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._sizes.pop(key)
+                del self._entries[key]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._total_bytes += size
+            # Evict least recently used entries until back under the limit
+            while self._total_bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(old_key)
+
+    def _store_on_disk(self, key, value):
+        path = self._disk_path(key)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Values that can't be pickled simply stay memory-only
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._trim_disk()
+
+    def _trim_disk(self):
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.pkl'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
@@ -0,0 +1,73 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from activity_store import RESOURCE_COLUMNS
+from allocation_solver import solve_arrays
+
+# What-if sweeps for the Resource Allocation Optimizer.
+#
+# The per-activity resource and impact vectors are extracted once and handed to
+# each worker process when it starts; every scenario then only sends its three
+# resource limits. Each scenario reports the best achievable impact (via
+# allocation_solver), the activities funded and the resources actually used.
+
+_worker_problem = None
+
+
+# Function to keep the shared activity vectors in each worker process
+def _init_worker(weights, impacts, method, time_limit):
+    global _worker_problem
+    _worker_problem = (weights, impacts, method, time_limit)
+
+
+def _solve_scenario(limits):
+    weights, impacts, method, time_limit = _worker_problem
+    result = solve_arrays(weights, np.asarray(limits, dtype="float64"), impacts, method,
+                          time_limit=time_limit, with_bound=False)
+    return {
+        "Budget": limits[0],
+        "Time": limits[1],
+        "Personnel": limits[2],
+        "Achievable Impact": result["impact"],
+        "Activities Funded": int(result["selected"].sum()),
+        "Budget Used": result["used"]["Budget"],
+        "Time Used": result["used"]["Time"],
+        "Personnel Used": result["used"]["Personnel"],
+        "Proven Optimal": result["optimal"],
+        "Solve Time (s)": result["solve_time"]
+    }
+
+
+# Function to evenly space up to n distinct values between low and high, rounded to cents
+def grid_values(low, high, steps):
+    if steps <= 1 or low == high:
+        return [low]
+    # Close values can round to the same cent; repeats would make impact_grid's pivot fail
+    return sorted(set(np.linspace(low, high, steps).round(2).tolist()))
+
+
+# Function to evaluate the allocation for every combination of budget, time and personnel limits
+def run_scenarios(df, budgets, times, personnel, method="heuristic", time_limit=1.0, workers=None):
+    weights = df[RESOURCE_COLUMNS].to_numpy(dtype="float64")
+    impacts = df["Impact Score"].to_numpy(dtype="float64")
+    scenarios = list(itertools.product(budgets, times, personnel))
+    workers = min(workers or os.cpu_count() or 1, len(scenarios))
+
+    if workers <= 1:
+        _init_worker(weights, impacts, method, time_limit)
+        rows = [_solve_scenario(limits) for limits in scenarios]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(weights, impacts, method, time_limit)) as executor:
+            rows = list(executor.map(_solve_scenario, scenarios, chunksize=max(1, len(scenarios) // (workers * 4))))
+    return pd.DataFrame(rows)
+
+
+# Function to pivot scenario results into a Budget x Time impact grid for one personnel level
+def impact_grid(results, personnel):
+    subset = results[results["Personnel"] == personnel]
+    return subset.pivot(index="Time", columns="Budget", values="Achievable Impact").sort_index()
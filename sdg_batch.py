@@ -0,0 +1,193 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sdg_toolkit.registry import get_sdg_data
+from sdg_toolkit.matcher import get_matcher
+
+# Headless bulk scoring for the SDG Alignment Calculator.
+#
+# Usage:
+#   python sdg_batch.py projects.csv -o results.csv --text-column description --id-column project_id
+#   python sdg_batch.py projects.jsonl -o results.jsonl --workers 8
+#
+# Rows are read, scored and written one at a time, so memory use does not grow
+# with the size of the input file. With --workers the corpus is split into chunks
+# that are scored in a process pool; only a bounded number of chunks is in flight
+# and results are written back in input order.
+
+
+# Function to score many descriptions with the Cal_v3 relevance logic (lazy, in input order)
+def match_sdgs_batch(descriptions, sdg_data=None, backend="matcher", chunk_size=500):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    sdg_data = sdg_data if sdg_data is not None else get_sdg_data()
+    if backend == "vectorized":
+        # Score chunk by chunk with one sparse matrix multiply each
+        from sdg_toolkit.vectorized import get_scoring_model
+        model = get_scoring_model(sdg_data)
+        descriptions = iter(descriptions)
+        for chunk in iter(lambda: list(itertools.islice(descriptions, chunk_size)), []):
+            yield from model.match_sdgs_batch(chunk)
+        return
+    if backend == "semantic":
+        # Rank by TF-IDF cosine similarity to each SDG's centroid instead of keyword counts
+        from sdg_toolkit.semantic import get_semantic_model
+        model = get_semantic_model(sdg_data)
+        descriptions = iter(descriptions)
+        for chunk in iter(lambda: list(itertools.islice(descriptions, chunk_size)), []):
+            yield from model.match_sdgs_batch(chunk)
+        return
+    matcher = get_matcher(sdg_data)
+    for project_desc in descriptions:
+        yield matcher.relevance_scores(project_desc or "")
+
+
+_worker_score = None
+
+
+# Function to build the backend's matcher or scoring model once in each worker process
+def _init_worker(sdg_data, backend="matcher"):
+    global _worker_score
+    if backend == "vectorized":
+        from sdg_toolkit.vectorized import get_scoring_model
+        model = get_scoring_model(sdg_data)
+        _worker_score = lambda chunk: model.match_sdgs_batch([project_desc or "" for project_desc in chunk])
+    elif backend == "semantic":
+        from sdg_toolkit.semantic import get_semantic_model
+        model = get_semantic_model(sdg_data)
+        _worker_score = model.match_sdgs_batch
+    else:
+        matcher = get_matcher(sdg_data)
+        _worker_score = lambda chunk: [matcher.relevance_scores(project_desc or "") for project_desc in chunk]
+
+
+def _score_chunk(chunk):
+    return _worker_score(chunk)
+
+
+# Function to score descriptions in a process pool, yielding results in input order
+def match_sdgs_parallel(descriptions, sdg_data=None, workers=None, chunk_size=500, backend="matcher"):
+    sdg_data = sdg_data if sdg_data is not None else get_sdg_data()
+    # The registry is read-only (and unpicklable); workers get plain dict copies
+    sdg_data = {sdg: dict(data) for sdg, data in sdg_data.items()}
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    descriptions = iter(descriptions)
+    chunks = iter(lambda: list(itertools.islice(descriptions, chunk_size)), [])
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(sdg_data, backend)) as executor:
+        # Keep a couple of chunks queued per worker; never read the whole corpus ahead
+        for chunk in chunks:
+            pending.append(executor.submit(_score_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# Function to lift the csv module's 128 KB field limit so long descriptions can be read
+def _raise_csv_field_limit():
+    limit = sys.maxsize
+    while True:
+        try:
+            csv.field_size_limit(limit)
+            return
+        except OverflowError:
+            # The limit is a C long, which is 32 bits on some platforms (e.g. Windows)
+            limit //= 2
+
+
+# Function to stream records from a CSV or JSONL file as dicts
+def read_records(path):
+    if path == "-":
+        handle = sys.stdin
+    else:
+        handle = open(path, newline="", encoding="utf-8")
+    try:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            _raise_csv_field_limit()
+            yield from csv.DictReader(handle)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+# Function to format ranked SDGs as "SDG (score); SDG (score)"
+def format_matches(matched_sdgs):
+    return "; ".join(f"{sdg} ({score})" for sdg, score in matched_sdgs)
+
+
+# Function to stream scored records to a CSV or JSONL file
+def write_results(path, rows):
+    jsonl = path.lower().endswith((".jsonl", ".ndjson"))
+    handle = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+    count = 0
+    try:
+        writer = None
+        if not jsonl:
+            writer = csv.writer(handle)
+            writer.writerow(["id", "top_sdg", "top_score", "matched_sdgs"])
+        for record_id, matched_sdgs in rows:
+            if jsonl:
+                handle.write(json.dumps({
+                    "id": record_id,
+                    "matches": [{"sdg": sdg, "score": score} for sdg, score in matched_sdgs]
+                }) + "\n")
+            else:
+                top_sdg, top_score = matched_sdgs[0] if matched_sdgs else ("", 0)
+                writer.writerow([record_id, top_sdg, top_score, format_matches(matched_sdgs)])
+            count += 1
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    return count
+
+
+# Function to pair each record id with its ranked SDGs
+def score_records(records, text_column, id_column=None, sdg_data=None, workers=1, chunk_size=500, backend="matcher"):
+    # Serially both copies advance in lockstep and tee buffers one record; the process pool reads
+    # up to workers * 2 chunks of descriptions ahead of the ids, so tee buffers about that many ids
+    id_records, text_records = itertools.tee(records)
+    ids = (record.get(id_column, row_number) if id_column else row_number
+           for row_number, record in enumerate(id_records, 1))
+    descriptions = (record.get(text_column, "") for record in text_records)
+    if workers == 1:
+        return zip(ids, match_sdgs_batch(descriptions, sdg_data, backend, chunk_size))
+    return zip(ids, match_sdgs_parallel(descriptions, sdg_data, workers, chunk_size, backend))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Score project descriptions against the SDGs in bulk.")
+    parser.add_argument("input", help="CSV or JSONL file of project records ('-' for CSV on stdin)")
+    parser.add_argument("-o", "--output", default="-", help="CSV or JSONL file for ranked results (default: stdout as CSV)")
+    parser.add_argument("--text-column", default="description", help="Field holding the project description")
+    parser.add_argument("--id-column", default=None, help="Field to copy into the results as the record id (default: row number)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to score with (0 = one per CPU core)")
+    parser.add_argument("--backend", choices=["matcher", "vectorized", "semantic"], default="matcher",
+                        help="Score row by row, chunk by chunk with the sparse matrix backend, "
+                             "or rank by TF-IDF similarity (semantic)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Descriptions sent to a worker at a time")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    records = read_records(args.input)
+    rows = score_records(records, args.text_column, args.id_column, workers=args.workers or None, chunk_size=args.chunk_size, backend=args.backend)
+    count = write_results(args.output, rows)
+    print(f"Scored {count} project descriptions.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from benchmark_suite import synthetic_descriptions
+
+# Local load generator for the SDG scoring service (sdg_service.py).
+#
+# Usage:
+#   python sdg_loadgen.py --spawn                          # start a service on the port, load it, stop it
+#   python sdg_loadgen.py --url http://127.0.0.1:8000 --concurrency 64 --requests 5000 --mode semantic
+#
+# Each of `concurrency` clients holds one keep-alive HTTP/1.1 connection and
+# sends POST /match requests back to back with seeded synthetic descriptions, so
+# the service sees that many requests in flight at once. Latency is measured per
+# request from send to full response; the report gives throughput, p50/p90/p99
+# and the number of batches the service scored (from /health).
+
+DEFAULT_URL = "http://127.0.0.1:8000"
+PERCENTILES = (50, 90, 99)
+
+
+class HTTPConnection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        self.writer.write(head.encode("ascii") + body)
+        await self.writer.drain()
+
+        status_line, *header_lines = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        response = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return int(status_line.split()[1]), json.loads(response or b"null")
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.writer = None
+
+
+async def _client(host, port, payloads, latencies, failures):
+    connection = HTTPConnection(host, port)
+    try:
+        while payloads:
+            payload = payloads.pop()
+            started = time.perf_counter()
+            try:
+                status, _ = await connection.request("POST", "/match", payload)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                failures.append("connection")
+                await connection.close()
+                continue
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                failures.append(status)
+    finally:
+        await connection.close()
+
+
+# Function to run the load test and return the throughput and latency summary
+async def run_load(url=DEFAULT_URL, requests=2000, concurrency=32, mode="keyword", words_per_doc=120, warmup=50):
+    parts = urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    descriptions = synthetic_descriptions(min(requests, 1000), words_per_doc)
+
+    # Warm-up requests are not timed, so connection setup doesn't skew the tail
+    await _client(host, port, [{"text": text, "mode": mode} for text in descriptions[:warmup]], [], [])
+    health = HTTPConnection(host, port)
+    _, before = await health.request("GET", "/health")
+
+    payloads = [{"text": descriptions[i % len(descriptions)], "mode": mode} for i in range(requests)]
+    latencies, failures = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, payloads, latencies, failures) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    _, after = await health.request("GET", "/health")
+    await health.close()
+    batches = after["batches"][mode] - before["batches"][mode]
+    documents = after["documents"][mode] - before["documents"][mode]
+    latency_ms = np.asarray(latencies) * 1000
+    summary = {
+        "mode": mode,
+        "requests": requests,
+        "concurrency": concurrency,
+        "failures": len(failures),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_batch_size": round(documents / batches, 1) if batches else 0.0,
+    }
+    for percentile in PERCENTILES:
+        summary[f"p{percentile}_ms"] = round(float(np.percentile(latency_ms, percentile)), 2) if len(latency_ms) else None
+    return summary
+
+
+# Function to start sdg_service under uvicorn and wait until /health answers
+def spawn_service(port, timeout=60):
+    service = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sdg_service.py")
+    process = subprocess.Popen([sys.executable, service, "--port", str(port)])
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"sdg_service exited with status {process.returncode}")
+        try:
+            status, body = asyncio.run(HTTPConnection("127.0.0.1", port).request("GET", "/health"))
+            if status == 200 and body["status"] == "ok":
+                return process
+        except OSError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"sdg_service did not become healthy within {timeout} s")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Measure throughput and tail latency of the SDG scoring service.")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Base URL of a running sdg_service")
+    parser.add_argument("--spawn", action="store_true", help="Start sdg_service on the URL's port for the run")
+    parser.add_argument("--requests", type=int, default=2000, help="Timed /match requests to send")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent keep-alive connections")
+    parser.add_argument("--mode", choices=("keyword", "semantic"), default="keyword", help="Matching mode to load")
+    parser.add_argument("--words", type=int, default=120, help="Words per synthetic description")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    process = spawn_service(urlsplit(args.url).port or 80) if args.spawn else None
+    try:
+        summary = asyncio.run(run_load(args.url, args.requests, args.concurrency, args.mode, args.words))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:<18} {value}")
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+
+from sdg_toolkit.registry import get_sdg_data, get_sdg_metrics
+from sdg_toolkit.metrics import suggest_metrics
+
+# Local HTTP scoring service for the SDG Alignment Calculator.
+#
+# Usage:
+#   python sdg_service.py --port 8000            # needs uvicorn
+#   curl -X POST localhost:8000/match -d '{"text": "food security for rural farmers"}'
+#
+# A plain ASGI application with no web framework. The scoring models are built
+# once at startup and stay warm for the life of the process. Concurrent /match
+# requests are queued, and a background task scores whatever has arrived within
+# a short window as one vectorized batch (the same ranking as Cal_v3 match_sdgs),
+# off the event loop. Endpoints:
+#   POST /match            {"text": "..."} or {"texts": [...]}, optional "mode": "keyword" | "semantic"
+#   GET|POST /metrics/suggest   ?sdg=...&sdg=... or {"sdgs": [...]}
+#   GET  /health
+
+MAX_BATCH_SIZE = 256
+BATCH_WINDOW_SECONDS = 0.002
+MAX_BODY_BYTES = 1024 * 1024
+MODES = ("keyword", "semantic")
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class MicroBatcher:
+    def __init__(self, score_batch, max_batch_size=MAX_BATCH_SIZE, window=BATCH_WINDOW_SECONDS):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.batches = 0
+        self.documents = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    # Function to queue one description and wait for its ranked SDGs
+    async def submit(self, text):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            # Give concurrent requests a moment to join the batch, then take everything that is waiting
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            texts = [text for text, _ in batch]
+            try:
+                results = await asyncio.to_thread(self.score_batch, texts)
+            except Exception as e:  # a scoring failure fails this batch's requests, not the service
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.batches += 1
+            self.documents += len(batch)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class SDGService:
+    def __init__(self, sdg_data=None, max_batch_size=MAX_BATCH_SIZE, window=BATCH_WINDOW_SECONDS):
+        self.sdg_data = sdg_data if sdg_data is not None else get_sdg_data()
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.batchers = {}
+        self.started = None
+
+    def _warm_models(self):
+        from sdg_toolkit.semantic import get_semantic_model
+        from sdg_toolkit.vectorized import get_scoring_model
+        keyword_model = get_scoring_model(self.sdg_data)
+        semantic_model = get_semantic_model(self.sdg_data)
+        # One throwaway call each so the first real request doesn't pay for lazy setup
+        keyword_model.match_sdgs_batch(["warm up"])
+        semantic_model.match_sdgs_batch(["warm up"])
+        return {"keyword": keyword_model.match_sdgs_batch, "semantic": semantic_model.match_sdgs_batch}
+
+    async def startup(self):
+        scorers = await asyncio.to_thread(self._warm_models)
+        for mode in MODES:
+            self.batchers[mode] = MicroBatcher(scorers[mode], self.max_batch_size, self.window)
+            self.batchers[mode].start()
+        self.started = time.monotonic()
+
+    async def shutdown(self):
+        for batcher in self.batchers.values():
+            await batcher.stop()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            status, payload = await self._route(scope, receive)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+        body = json.dumps(payload).encode("utf-8")
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": f"{type(e).__name__}: {e}"})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _route(self, scope, receive):
+        path, method = scope["path"].rstrip("/") or "/", scope["method"]
+        if path == "/health":
+            self._require(method, ("GET",))
+            return 200, self.health()
+        if path == "/match":
+            self._require(method, ("POST",))
+            return 200, await self.match(await self._read_json(receive))
+        if path == "/metrics/suggest":
+            self._require(method, ("GET", "POST"))
+            if method == "GET":
+                sdgs = parse_qs(scope.get("query_string", b"").decode("utf-8")).get("sdg", [])
+            else:
+                sdgs = (await self._read_json(receive)).get("sdgs", [])
+            return 200, self.suggest(sdgs)
+        raise HTTPError(404, f"Not found: {path}")
+
+    def _require(self, method, allowed):
+        if method not in allowed:
+            raise HTTPError(405, f"Method {method} not allowed")
+
+    async def _read_json(self, receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise HTTPError(413, f"Request body larger than {MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        try:
+            payload = json.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Request body is not valid JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        return payload
+
+    # Function to rank SDGs for one description ("text") or several ("texts")
+    async def match(self, payload):
+        mode = payload.get("mode", "keyword")
+        if not isinstance(mode, str) or mode not in MODES:
+            raise HTTPError(400, f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+        if self.started is None:
+            raise HTTPError(503, "The scoring models are still loading")
+        batcher = self.batchers[mode]
+        if "texts" in payload:
+            texts = payload["texts"]
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise HTTPError(400, "'texts' must be a list of strings")
+            results = await asyncio.gather(*(batcher.submit(text) for text in texts))
+            return {"mode": mode, "results": [self._format(matches) for matches in results]}
+        text = payload.get("text")
+        if not isinstance(text, str):
+            raise HTTPError(400, "Provide 'text' (a string) or 'texts' (a list of strings)")
+        return {"mode": mode, "matches": self._format(await batcher.submit(text))}
+
+    def _format(self, matches):
+        return [{"sdg": sdg, "score": score} for sdg, score in matches]
+
+    def suggest(self, sdgs):
+        if not isinstance(sdgs, list) or not all(isinstance(sdg, str) for sdg in sdgs):
+            raise HTTPError(400, "'sdgs' must be a list of SDG names")
+        sdg_metrics = get_sdg_metrics()
+        unknown = [sdg for sdg in sdgs if sdg not in sdg_metrics]
+        if unknown:
+            raise HTTPError(400, f"Unknown SDG(s): {', '.join(map(str, unknown))}")
+        return {"metrics": {sdg: list(metrics) for sdg, metrics in suggest_metrics(sdgs, sdg_metrics).items()}}
+
+    def health(self):
+        return {
+            "status": "ok" if self.started is not None else "starting",
+            "uptime_seconds": round(time.monotonic() - self.started, 3) if self.started is not None else 0,
+            "batches": {mode: batcher.batches for mode, batcher in self.batchers.items()},
+            "documents": {mode: batcher.documents for mode, batcher in self.batchers.items()},
+        }
+
+
+app = SDGService()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serve SDG alignment scores over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--batch-size", type=int, default=MAX_BATCH_SIZE, help="Most descriptions scored per batch")
+    parser.add_argument("--batch-window-ms", type=float, default=BATCH_WINDOW_SECONDS * 1000,
+                        help="How long a batch waits for more requests after the first one")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    import uvicorn
+    service = SDGService(max_batch_size=args.batch_size, window=args.batch_window_ms / 1000)
+    uvicorn.run(service, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
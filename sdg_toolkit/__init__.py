@@ -0,0 +1,47 @@
+import importlib
+
+# Headless core of the SDG toolkit, importable without Streamlit.
+#
+# The pure functions behind the Streamlit tools live in the submodules below and
+# are re-exported here lazily: `import sdg_toolkit` loads nothing but this file,
+# and each submodule (and any heavy dependency it needs, such as pandas, PyPDF2
+# or docx2txt) is imported the first time one of its names is used. The SDG
+# registry, keyword matcher, vectorized and semantic scoring models, PDF
+# extraction and stage profiler live in the package too, so it only needs
+# itself on sys.path.
+#
+#   from sdg_toolkit import match_sdgs
+#   match_sdgs("A program to improve nutrition and food security in rural areas.")
+
+_EXPORTS = {
+    "match_sdgs": "matching",
+    "matched_sdgs": "matching",
+    "found_keywords": "matching",
+    "match_sdgs_semantic": "matching",
+    "get_sdg_data": "registry",
+    "get_sdg_metrics": "registry",
+    "suggest_metrics": "metrics",
+    "generate_timeline": "timeline",
+    "calculate_efficiency": "allocation",
+    "calculate_impact": "impact",
+    "load_data": "ingestion",
+    "parse_csv": "ingestion",
+    "parse_excel": "ingestion",
+    "parse_pdf": "ingestion",
+    "parse_docx": "ingestion",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,3 @@
+# Function to compute Impact Score / (Budget + Time + Personnel) for one activity
+def calculate_efficiency(row):
+    return row['Impact Score'] / (row['Budget'] + row['Time'] + row['Personnel'])
@@ -0,0 +1,9 @@
+from .profiling import instrument
+
+
+@instrument("calculate_impact")
+def calculate_impact(df):
+    # This is a placeholder function. In a real-world scenario,
+    # you would implement more sophisticated impact calculations here.
+    impact_score = df.select_dtypes(include='number').sum().sum()  # Simple sum of all numeric values
+    return impact_score
@@ -0,0 +1,60 @@
+from .profiling import instrument
+
+# Parsers behind the Impact Calculator's load_data, usable without Streamlit.
+#
+# pandas, PyPDF2 and docx2txt are imported inside the parser that needs them, so
+# importing this module costs nothing until a file is actually parsed.
+
+SUPPORTED_EXTENSIONS = ('csv', 'txt', 'xlsx', 'xls', 'pdf', 'docx')
+
+
+class UnsupportedFormatError(ValueError):
+    pass
+
+
+def parse_csv(uploaded_file):
+    import pandas as pd
+    return pd.read_csv(uploaded_file)
+
+
+def parse_excel(uploaded_file):
+    import pandas as pd
+    return pd.read_excel(uploaded_file)
+
+
+# Function to read a PDF into a one-row frame of lines; on_page(done, total, text) is called per page
+def parse_pdf(uploaded_file, on_page=None):
+    import pandas as pd
+    from .pdf import iter_pdf_pages
+    # Collect page texts and join once instead of growing one string page by page
+    pages = []
+    for num_pages, page_text in iter_pdf_pages(uploaded_file):
+        pages.append(page_text)
+        if on_page is not None:
+            on_page(len(pages), num_pages, page_text)
+    text = "".join(pages)
+    return pd.DataFrame([text.split('\n')])
+
+
+def parse_docx(uploaded_file):
+    import docx2txt
+    import pandas as pd
+    text = docx2txt.process(uploaded_file)
+    return pd.DataFrame([text.split('\n')])
+
+
+# Function to parse an uploaded file by its extension; raises UnsupportedFormatError for other formats
+@instrument("load_data")
+def load_data(uploaded_file, on_page=None, name=None):
+    if uploaded_file is None:
+        return None
+    file_extension = (name or uploaded_file.name).split('.')[-1].lower()
+    if file_extension in ['csv', 'txt']:
+        return parse_csv(uploaded_file)
+    if file_extension in ['xlsx', 'xls']:
+        return parse_excel(uploaded_file)
+    if file_extension == 'pdf':
+        return parse_pdf(uploaded_file, on_page)
+    if file_extension == 'docx':
+        return parse_docx(uploaded_file)
+    raise UnsupportedFormatError(f"Unsupported file format: {file_extension}")
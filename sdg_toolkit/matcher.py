@@ -0,0 +1,161 @@
+import bisect
+import re
+
+# Keyword matcher for the SDG calculators.
+#
+# All keywords of all SDGs are compiled into one trie-shaped regular expression,
+# so a description is lowercased once and scanned once instead of once per keyword.
+# The scan reports the longest keyword starting at each position; every other
+# keyword starting there is a prefix of it, so the full set of hits per position
+# is looked up from a precomputed prefix table.
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+# Function to build a regex fragment for a trie node (longest alternative wins)
+def _trie_pattern(node):
+    end = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not end:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if end else body
+
+
+# Function to find the length of the common prefix of two strings (binary search over C-level slice compares)
+def _common_prefix_length(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class SDGMatcher:
+    def __init__(self, sdg_data, whole_words=False):
+        self.whole_words = whole_words
+        self.sdg_keywords = {sdg: [kw.lower() for kw in data['keywords']] for sdg, data in sdg_data.items()}
+
+        # Unique keywords in first-seen order, and the SDGs each keyword belongs to
+        self.keywords = []
+        self.keyword_sdgs = {}
+        for sdg, keywords in self.sdg_keywords.items():
+            for kw in keywords:
+                if kw not in self.keyword_sdgs:
+                    self.keywords.append(kw)
+                    self.keyword_sdgs[kw] = []
+                if sdg not in self.keyword_sdgs[kw]:
+                    self.keyword_sdgs[kw].append(sdg)
+
+        trie = {}
+        for kw in self.keywords:
+            node = trie
+            for char in kw:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self._pattern = re.compile("(?=(" + _trie_pattern(trie) + "))") if self.keywords else None
+
+        # Keywords that match at the same position as a longer one are its prefixes
+        self._prefixes = {kw: [other for other in self.keywords if kw.startswith(other)] for kw in self.keywords}
+        self.max_keyword_length = max((len(kw) for kw in self.keywords), default=0)
+
+    # Function to yield (start, keyword) for every keyword occurrence starting in text[pos:endpos]
+    def _scan(self, text, pos=0, endpos=None):
+        if self._pattern is None:
+            return
+        endpos = len(text) if endpos is None else endpos
+        for match in self._pattern.finditer(text, pos, endpos):
+            start = match.start()
+            if self.whole_words and start > 0 and _WORD_CHAR.match(text, start - 1):
+                continue
+            for kw in self._prefixes[match.group(1)]:
+                end = start + len(kw)
+                if self.whole_words and end < len(text) and _WORD_CHAR.match(text, end):
+                    continue
+                yield start, kw
+
+    # Function to count occurrences of every keyword in a single pass
+    def count_keywords(self, text):
+        counts = {}
+        last_end = {}
+        for start, kw in self._scan(text.lower()):
+            # str.count semantics: occurrences of the same keyword never overlap
+            if start < last_end.get(kw, 0):
+                continue
+            last_end[kw] = start + len(kw)
+            counts[kw] = counts.get(kw, 0) + 1
+        return counts
+
+    # Function to list all keyword occurrences as sorted (start, keyword) pairs in the lowercased text
+    def occurrences(self, text):
+        return list(self._scan(text.lower()))
+
+    # Function to update the occurrences of old_text for new_text, rescanning only the edited region
+    def rescan(self, old_text, old_occurrences, new_text):
+        old_text, new_text = old_text.lower(), new_text.lower()
+        prefix = _common_prefix_length(old_text, new_text)
+        suffix = _common_prefix_length(old_text[prefix:][::-1], new_text[prefix:][::-1])
+        old_cut = len(old_text) - suffix + 1
+        new_cut = len(new_text) - suffix + 1
+
+        # A match depends on its own characters plus one neighbour on each side (word
+        # boundaries), so anything starting this far from the edit is unaffected
+        margin = self.max_keyword_length + 1
+        low = max(0, prefix - margin)
+        high = min(len(new_text), new_cut + margin)
+
+        starts = [start for start, _ in old_occurrences]
+        head = old_occurrences[:bisect.bisect_left(starts, low)]
+        middle = [(start, kw) for start, kw in self._scan(new_text, low, high) if start < new_cut]
+        shift = len(new_text) - len(old_text)
+        tail = [(start + shift, kw) for start, kw in old_occurrences[bisect.bisect_left(starts, old_cut):]]
+        return head + middle + tail
+
+    # Function to map each SDG to the keywords found for it and their counts
+    def sdg_hits(self, text):
+        counts = self.count_keywords(text)
+        hits = {}
+        for sdg, keywords in self.sdg_keywords.items():
+            found = {kw: counts[kw] for kw in keywords if kw in counts}
+            if found:
+                hits[sdg] = found
+        return hits
+
+    # Function to list matched SDGs in registry order (Cal_v2 behaviour)
+    def matched_sdgs(self, text):
+        return list(self.sdg_hits(text))
+
+    # Function to rank matched SDGs by relevance score (Cal_v3 behaviour)
+    def relevance_scores(self, text):
+        counts = self.count_keywords(text)
+        matched = []
+        for sdg, keywords in self.sdg_keywords.items():
+            relevance_score = sum(counts.get(kw, 0) for kw in keywords)
+            if relevance_score > 0:
+                matched.append((sdg, relevance_score))
+        return sorted(matched, key=lambda x: x[1], reverse=True)
+
+    # Function to list the distinct keywords present in the text
+    def found_keywords(self, text):
+        return self.keywords_in(self.occurrences(text))
+
+    # Function to list the distinct keywords in a list of occurrences, in registry order
+    def keywords_in(self, occurrences):
+        present = {kw for _, kw in occurrences}
+        return [kw for kw in self.keywords if kw in present]
+
+
+_matchers = {}
+
+
+# Function to get a matcher for the given SDG data, built once per process
+def get_matcher(sdg_data, whole_words=False):
+    key = (tuple((sdg, tuple(data['keywords'])) for sdg, data in sdg_data.items()), whole_words)
+    if key not in _matchers:
+        _matchers[key] = SDGMatcher(sdg_data, whole_words)
+    return _matchers[key]
@@ -0,0 +1,29 @@
+from .matcher import get_matcher
+from .registry import get_sdg_data
+from .profiling import instrument
+
+# SDG matching without any UI: the keyword logic of the SDG Alignment
+# Calculators and the optional semantic ranking mode.
+
+
+# Function to rank SDGs by keyword relevance score, as in Cal_v3
+@instrument("match_sdgs")
+def match_sdgs(project_desc, sdg_data=None):
+    return get_matcher(sdg_data if sdg_data is not None else get_sdg_data()).relevance_scores(project_desc)
+
+
+# Function to list the SDGs with at least one keyword in the description, as in Cal_v1/Cal_v2
+def matched_sdgs(project_desc, sdg_data=None):
+    return get_matcher(sdg_data if sdg_data is not None else get_sdg_data()).matched_sdgs(project_desc)
+
+
+# Function to list the SDG keywords found in the description, for live feedback
+def found_keywords(project_desc, sdg_data=None):
+    return get_matcher(sdg_data if sdg_data is not None else get_sdg_data()).found_keywords(project_desc)
+
+
+# Function to rank SDGs by TF-IDF similarity (loads NumPy/SciPy on first use)
+@instrument("match_sdgs.semantic")
+def match_sdgs_semantic(project_desc, sdg_data=None):
+    from .semantic import get_semantic_model
+    return get_semantic_model(sdg_data if sdg_data is not None else get_sdg_data()).match_sdgs(project_desc)
@@ -0,0 +1,11 @@
+from .registry import get_sdg_metrics
+
+
+# Function to look up the suggested impact metrics for each selected SDG
+def suggest_metrics(selected_sdgs, sdg_metrics=None):
+    if sdg_metrics is None:
+        sdg_metrics = get_sdg_metrics()
+    suggested_metrics = {}
+    for sdg in selected_sdgs:
+        suggested_metrics[sdg] = sdg_metrics.get(sdg, [])
+    return suggested_metrics
@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+# Page-by-page PDF text extraction for the Impact Calculator.
+#
+# Pages are yielded in order as soon as they are extracted, so callers can show
+# progress and a preview while a long document is still being parsed. Large PDFs
+# are split across a process pool, each worker opening the document once. The
+# worker functions live here rather than in the Streamlit script so that they
+# can be pickled by reference. PyPDF2 is imported on first use.
+
+# PDFs with at least this many pages are extracted in a process pool
+PARALLEL_PDF_MIN_PAGES = 32
+
+_worker_pdf_reader = None
+
+
+# Function to open the PDF once in each worker process
+def _init_pdf_worker(pdf_bytes):
+    global _worker_pdf_reader
+    import PyPDF2
+    _worker_pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+
+
+def _extract_pdf_page(page_number):
+    return _worker_pdf_reader.pages[page_number].extract_text()
+
+
+# Function to yield (page_count, page_text) for each PDF page in order, as soon as it is extracted
+def iter_pdf_pages(uploaded_file, workers=None):
+    pdf_bytes = uploaded_file.getvalue() if hasattr(uploaded_file, 'getvalue') else uploaded_file.read()
+    import PyPDF2
+    pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+    num_pages = len(pdf_reader.pages)
+    workers = workers or os.cpu_count() or 1
+
+    if num_pages < PARALLEL_PDF_MIN_PAGES or workers == 1:
+        for page in pdf_reader.pages:
+            yield num_pages, page.extract_text()
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker, initargs=(pdf_bytes,)) as executor:
+        for page_text in executor.map(_extract_pdf_page, range(num_pages), chunksize=4):
+            yield num_pages, page_text
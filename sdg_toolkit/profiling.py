@@ -0,0 +1,264 @@
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# Per-stage instrumentation for the toolkit's hot paths.
+#
+# Usage:
+#   @instrument("calculate_impact")
+#   def calculate_impact(df): ...
+#
+#   with stage("generate_report.png_export"):
+#       images = render_figures_png(figs)
+#
+#   SDG_PROFILE=1 streamlit run Impact_Calculator_Report_Generator_v1.py       # wall time and call counts
+#   SDG_PROFILE=memory streamlit run Impact_Calculator_Report_Generator_v1.py  # plus peak memory per stage
+#
+# Recording is off unless SDG_PROFILE is set or enable() is called. While it is
+# off, an instrumented function costs one attribute check before calling through
+# and stage() returns a shared no-op context. Peak memory comes from tracemalloc,
+# which slows allocation-heavy code noticeably, so it is only started when asked
+# for. It is process-wide: with stages running on several threads at once, each
+# stage's peak also counts the other threads' allocations. Stats are kept per
+# process (so shared by every Streamlit session) and can be exported as
+# Prometheus text or JSON.
+
+METRIC_PREFIX = "sdg_stage"
+
+
+class StageStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.min_seconds = None
+        self.max_seconds = 0.0
+        self.last_seconds = 0.0
+        self.peak_memory_bytes = None
+
+    def record(self, seconds, peak_memory_bytes=None, failed=False):
+        self.calls += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        self.min_seconds = seconds if self.min_seconds is None else min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.last_seconds = seconds
+        if peak_memory_bytes is not None:
+            self.peak_memory_bytes = max(self.peak_memory_bytes or 0, peak_memory_bytes)
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "min_seconds": self.min_seconds or 0.0,
+            "max_seconds": self.max_seconds,
+            "last_seconds": self.last_seconds,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+class _StageTimer:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.memory = self.profiler.track_memory and tracemalloc.is_tracing()
+        if self.memory:
+            stack = self.profiler._memory_stack()
+            if stack:
+                # Fold the enclosing stage's peak so far into its own record before the counter is reset
+                stack[-1][1] = max(stack[-1][1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            self.frame = [current, current]
+            stack.append(self.frame)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.started
+        peak = None
+        if self.memory:
+            stack = self.profiler._memory_stack()
+            stack.pop()
+        # Memory tracking may have been switched off while the stage ran
+        if self.memory and tracemalloc.is_tracing():
+            peak_absolute = max(self.frame[1], tracemalloc.get_traced_memory()[1])
+            peak = peak_absolute - self.frame[0]
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak_absolute)
+        self.profiler.record(self.name, seconds, peak, failed=exc_type is not None)
+        return False
+
+
+class StageProfiler:
+    def __init__(self, enabled=False, track_memory=False):
+        self.enabled = False
+        self.track_memory = False
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+        if enabled:
+            self.enable(track_memory)
+
+    # Function to start recording; track_memory also starts tracemalloc for per-stage peak memory
+    def enable(self, track_memory=False):
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif not track_memory:
+            self._stop_tracemalloc()
+        self.track_memory = track_memory
+        self.enabled = True
+
+    # Function to stop recording (the stats gathered so far are kept)
+    def disable(self):
+        self.enabled = False
+        self.track_memory = False
+        self._stop_tracemalloc()
+
+    def _stop_tracemalloc(self):
+        # Only stop tracemalloc if this profiler started it
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _memory_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def record(self, name, seconds, peak_memory_bytes=None, failed=False):
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = StageStats()
+            self._stats[name].record(seconds, peak_memory_bytes, failed)
+
+    # Function to time a block as the named stage; a shared no-op context while disabled
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _StageTimer(self, name)
+
+    # Function to decorate a function so every call is recorded as the named stage
+    def instrument(self, name=None):
+        def decorate(func):
+            stage_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _StageTimer(self, stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    # Function to get {stage: stats dict} for every stage recorded so far
+    def snapshot(self):
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in sorted(self._stats.items())}
+
+    # Function to export the stats as a JSON document
+    def to_json(self, indent=2):
+        return json.dumps({"enabled": self.enabled, "track_memory": self.track_memory, "stages": self.snapshot()},
+                          indent=indent)
+
+    # Function to export the stats in the Prometheus text exposition format
+    def to_prometheus(self, prefix=METRIC_PREFIX):
+        snapshot = self.snapshot()
+        metrics = [
+            ("calls_total", "counter", "Calls recorded per stage.", "calls"),
+            ("errors_total", "counter", "Calls per stage that raised an exception.", "errors"),
+            ("seconds_total", "counter", "Total wall time per stage in seconds.", "total_seconds"),
+            ("seconds_max", "gauge", "Slowest call per stage in seconds.", "max_seconds"),
+            ("seconds_last", "gauge", "Most recent call per stage in seconds.", "last_seconds"),
+            ("peak_memory_bytes", "gauge", "Largest traced memory peak per stage in bytes.", "peak_memory_bytes"),
+        ]
+        lines = []
+        for suffix, kind, help_text, key in metrics:
+            samples = [(name, stats[key]) for name, stats in snapshot.items() if stats[key] is not None]
+            if not samples:
+                continue
+            lines.append(f"# HELP {prefix}_{suffix} {help_text}")
+            lines.append(f"# TYPE {prefix}_{suffix} {kind}")
+            for name, value in samples:
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{prefix}_{suffix}{{stage="{label}"}} {value!r}')
+        return "\n".join(lines) + "\n" if lines else ""
+
+    # Function to turn the stats into a table for display
+    def to_frame(self):
+        import pandas as pd
+        frame = pd.DataFrame.from_dict(self.snapshot(), orient="index")
+        if frame.empty:
+            return frame
+        for column in ("total_seconds", "mean_seconds", "min_seconds", "max_seconds", "last_seconds"):
+            frame[column.replace("_seconds", " (ms)")] = frame.pop(column) * 1000
+        frame["peak memory (MiB)"] = frame.pop("peak_memory_bytes").astype(float) / (1024 * 1024)
+        return frame.rename_axis("stage")
+
+
+_NULL_CONTEXT = nullcontext()
+_OFF_VALUES = ("", "0", "false", "off", "no")
+
+
+# Function to read an environment variable or query parameter as a switch ("0", "false", "off" and "no" mean off)
+def _switched_on(value):
+    return value is not None and value.strip().lower() not in _OFF_VALUES
+
+
+# The process-wide profiler behind the module-level helpers; SDG_PROFILE=1 records time, SDG_PROFILE=memory also memory
+_mode = os.environ.get("SDG_PROFILE", "")
+profiler = StageProfiler(enabled=_switched_on(_mode), track_memory=_mode.strip().lower() == "memory")
+del _mode
+
+instrument = profiler.instrument
+stage = profiler.stage
+enable = profiler.enable
+disable = profiler.disable
+reset = profiler.reset
+snapshot = profiler.snapshot
+to_json = profiler.to_json
+to_prometheus = profiler.to_prometheus
+
+
+# Function to show the stage stats in a Streamlit sidebar expander; shown only with SDG_PROFILE set or ?debug=1
+def render_debug_panel(force=False):
+    import streamlit as st
+    if not (force or _switched_on(os.environ.get("SDG_PROFILE")) or _switched_on(st.query_params.get("debug"))):
+        return
+    with st.sidebar.expander("🛠️ Stage profiler", expanded=profiler.enabled):
+        record = st.checkbox("Record stage timings", value=profiler.enabled, key="stage_profiler_enabled")
+        memory = st.checkbox("Track peak memory (slower)", value=profiler.track_memory, key="stage_profiler_memory",
+                             disabled=not record)
+        if record and (not profiler.enabled or memory != profiler.track_memory):
+            profiler.enable(track_memory=memory)
+        elif not record and profiler.enabled:
+            profiler.disable()
+
+        frame = profiler.to_frame()
+        if frame.empty:
+            st.caption("No stages recorded yet.")
+        else:
+            st.dataframe(frame.style.format(precision=2), width="stretch")
+        if st.button("Reset stats", key="stage_profiler_reset"):
+            profiler.reset()
+            st.rerun()
+        st.download_button("Prometheus metrics", data=profiler.to_prometheus, file_name="stage_metrics.prom",
+                           mime="text/plain", key="stage_profiler_prometheus")
+        st.download_button("JSON stats", data=profiler.to_json, file_name="stage_metrics.json",
+                           mime="application/json", key="stage_profiler_json")
@@ -0,0 +1,196 @@
+from types import MappingProxyType
+
+# Shared SDG registry for all tools.
+#
+# The SDG keywords, descriptions and impact metrics are defined once here and
+# frozen at import time, so every tool (and every Streamlit rerun) reuses the same
+# read-only objects instead of rebuilding the nested dicts on each call.
+
+_SDG_DATA = {
+    "No Poverty": {
+        "keywords": ["poverty", "inequality", "economic growth", "income", "unemployment", "social protection", "vulnerable", "access to resources"],
+        "description": "End poverty in all its forms everywhere."
+    },
+    "Zero Hunger": {
+        "keywords": ["hunger", "nutrition", "food security", "agriculture", "farming", "sustainable agriculture", "malnutrition", "crop production"],
+        "description": "End hunger, achieve food security and improved nutrition, and promote sustainable agriculture."
+    },
+    "Good Health and Well-being": {
+        "keywords": ["health", "well-being", "disease", "mental health", "medical care", "vaccines", "hygiene", "pandemic", "sanitation", "healthcare access"],
+        "description": "Ensure healthy lives and promote well-being for all at all ages."
+    },
+    "Quality Education": {
+        "keywords": ["education", "learning", "schooling", "literacy", "early childhood", "teacher training", "inclusive education", "vocational training", "skills development"],
+        "description": "Ensure inclusive and equitable quality education and promote lifelong learning opportunities for all."
+    },
+    "Gender Equality": {
+        "keywords": ["gender", "women", "girls", "discrimination", "violence against women", "female empowerment", "gender equality", "equal pay", "access to education"],
+        "description": "Achieve gender equality and empower all women and girls."
+    },
+    "Clean Water and Sanitation": {
+        "keywords": ["water", "sanitation", "hygiene", "clean water", "water resources", "wastewater", "pollution", "access to water", "sustainable water management"],
+        "description": "Ensure availability and sustainable management of water and sanitation for all."
+    },
+    "Affordable and Clean Energy": {
+        "keywords": ["energy", "renewable energy", "clean energy", "solar power", "wind energy", "energy efficiency", "affordable energy", "sustainable energy", "access to electricity"],
+        "description": "Ensure access to affordable, reliable, sustainable, and modern energy for all."
+    },
+    "Decent Work and Economic Growth": {
+        "keywords": ["economic growth", "employment", "jobs", "labor market", "decent work", "unemployment", "entrepreneurship", "economic productivity", "equal pay"],
+        "description": "Promote sustained, inclusive, and sustainable economic growth, full and productive employment, and decent work for all."
+    },
+    "Industry, Innovation and Infrastructure": {
+        "keywords": ["infrastructure", "innovation", "industrialization", "technology", "research", "development", "sustainable industries", "manufacturing", "resilient infrastructure"],
+        "description": "Build resilient infrastructure, promote inclusive and sustainable industrialization, and foster innovation."
+    },
+    "Reduced Inequality": {
+        "keywords": ["inequality", "social inequality", "discrimination", "income inequality", "social inclusion", "disparities", "disabilities", "economic disparity"],
+        "description": "Reduce inequality within and among countries."
+    },
+    "Sustainable Cities and Communities": {
+        "keywords": ["urbanization", "cities", "sustainable cities", "housing", "slums", "urban planning", "public transport", "sustainability", "community development"],
+        "description": "Make cities and human settlements inclusive, safe, resilient, and sustainable."
+    },
+    "Responsible Consumption and Production": {
+        "keywords": ["sustainable consumption", "sustainable production", "waste", "resource efficiency", "recycling", "food waste", "environmental impact", "eco-friendly"],
+        "description": "Ensure sustainable consumption and production patterns."
+    },
+    "Climate Action": {
+        "keywords": ["climate change", "global warming", "carbon emissions", "climate resilience", "environmental protection", "disaster risk", "climate policies", "renewable energy"],
+        "description": "Take urgent action to combat climate change and its impacts."
+    },
+    "Life Below Water": {
+        "keywords": ["oceans", "marine life", "fisheries", "water pollution", "marine conservation", "sustainable fishing", "coral reefs", "plastic waste", "ocean health"],
+        "description": "Conserve and sustainably use the oceans, seas, and marine resources for sustainable development."
+    },
+    "Life on Land": {
+        "keywords": ["forests", "biodiversity", "deforestation", "land degradation", "ecosystems", "wildlife", "desertification", "land conservation", "sustainable land use"],
+        "description": "Protect, restore, and promote sustainable use of terrestrial ecosystems, sustainably manage forests, combat desertification, and halt biodiversity loss."
+    },
+    "Peace, Justice and Strong Institutions": {
+        "keywords": ["peace", "justice", "institutions", "governance", "rule of law", "human rights", "violence prevention", "corruption", "inclusive societies"],
+        "description": "Promote peaceful and inclusive societies, provide access to justice for all, and build effective, accountable institutions."
+    },
+    "Partnerships for the Goals": {
+        "keywords": ["partnerships", "collaboration", "international cooperation", "public-private partnerships", "global goals", "resource mobilization", "capacity building", "shared responsibility"],
+        "description": "Strengthen the means of implementation and revitalize the global partnership for sustainable development."
+    }
+}
+
+_SDG_METRICS = {
+    "No Poverty": [
+        "Number of individuals lifted above poverty line",
+        "Percentage increase in household income",
+        "Number of people provided with access to financial services"
+    ],
+    "Zero Hunger": [
+        "Number of people provided with food assistance",
+        "Increase in crop yield for small-scale farmers",
+        "Reduction in malnutrition rates"
+    ],
+    "Good Health and Well-being": [
+        "Number of people provided with essential healthcare services",
+        "Reduction in maternal mortality rate",
+        "Increase in vaccination rates"
+    ],
+    "Quality Education": [
+        "Number of children enrolled in primary education",
+        "Improvement in literacy rates",
+        "Number of teachers trained"
+    ],
+    "Gender Equality": [
+        "Percentage increase in women's workforce participation",
+        "Reduction in gender-based violence cases",
+        "Number of girls receiving secondary education"
+    ],
+    "Clean Water and Sanitation": [
+        "Number of people provided with access to clean water",
+        "Reduction in waterborne diseases",
+        "Number of households with improved sanitation facilities"
+    ],
+    "Affordable and Clean Energy": [
+        "Number of households provided with access to electricity",
+        "Percentage increase in renewable energy usage",
+        "Reduction in carbon emissions from energy production"
+    ],
+    "Decent Work and Economic Growth": [
+        "Number of jobs created",
+        "Increase in GDP per capita",
+        "Reduction in youth unemployment rate"
+    ],
+    "Industry, Innovation and Infrastructure": [
+        "Increase in R&D expenditure as a proportion of GDP",
+        "Number of new patents filed",
+        "Kilometers of new or improved roads/railways"
+    ],
+    "Reduced Inequality": [
+        "Reduction in income inequality (Gini coefficient)",
+        "Increase in social mobility index",
+        "Percentage of population covered by social protection systems"
+    ],
+    "Sustainable Cities and Communities": [
+        "Reduction in urban air pollution levels",
+        "Increase in green spaces per capita",
+        "Percentage of population with access to public transportation"
+    ],
+    "Responsible Consumption and Production": [
+        "Reduction in food waste per capita",
+        "Increase in recycling rates",
+        "Number of companies adopting sustainable practices"
+    ],
+    "Climate Action": [
+        "Reduction in greenhouse gas emissions",
+        "Number of people benefiting from climate adaptation measures",
+        "Increase in climate-resilient infrastructure"
+    ],
+    "Life Below Water": [
+        "Increase in marine protected areas",
+        "Reduction in ocean plastic pollution",
+        "Improvement in fish stock levels"
+    ],
+    "Life on Land": [
+        "Increase in forest cover",
+        "Number of endangered species protected",
+        "Reduction in land degradation"
+    ],
+    "Peace, Justice and Strong Institutions": [
+        "Reduction in corruption perception index",
+        "Increase in voter turnout",
+        "Improvement in rule of law index"
+    ],
+    "Partnerships for the Goals": [
+        "Increase in development assistance",
+        "Number of multi-stakeholder partnerships formed",
+        "Improvement in data availability for SDG monitoring"
+    ]
+}
+
+
+# Frozen registry: SDG name -> {"number", "keywords" (tuple), "description"}
+SDG_DATA = MappingProxyType({
+    sdg: MappingProxyType({
+        "number": number,
+        "keywords": tuple(data["keywords"]),
+        "description": data["description"]
+    })
+    for number, (sdg, data) in enumerate(_SDG_DATA.items(), 1)
+})
+
+# SDG number <-> name index
+SDG_NAMES = MappingProxyType({data["number"]: sdg for sdg, data in SDG_DATA.items()})
+SDG_NUMBERS = MappingProxyType({sdg: number for number, sdg in SDG_NAMES.items()})
+
+# SDG name -> suggested impact metrics
+SDG_METRICS = MappingProxyType({sdg: tuple(metrics) for sdg, metrics in _SDG_METRICS.items()})
+
+del _SDG_DATA, _SDG_METRICS
+
+
+# Function to get the SDGs with their keywords and descriptions
+def get_sdg_data():
+    return SDG_DATA
+
+
+# Function to get the SDGs with their associated impact metrics
+def get_sdg_metrics():
+    return SDG_METRICS
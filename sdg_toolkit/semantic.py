@@ -0,0 +1,129 @@
+import math
+import re
+from functools import lru_cache
+
+import numpy as np
+from scipy import sparse
+
+# Offline semantic ranking mode for the SDG Alignment Calculator.
+#
+# Each SDG's keywords and description are turned into one TF-IDF vector over
+# stemmed word unigrams and bigrams, and the L2-normalized vectors are stacked
+# into a fixed SDG centroid matrix when the model is built. A batch of documents
+# is vectorized into a sparse matrix with the same vocabulary, and every cosine
+# similarity comes from one sparse matrix multiply. Matching is on whole tokens,
+# so "water" no longer hits "waterproof", and terms shared by several SDGs
+# ("hygiene", "sanitation") get a lower IDF weight. Runs on CPU only with NumPy
+# and SciPy.
+
+MIN_SIMILARITY = 0.05
+# Keywords are the curated signal, so they count more than words from the description
+KEYWORD_WEIGHT = 2
+
+_TOKEN = re.compile(r"[a-z][a-z0-9]+")
+_STOPWORDS = frozenset("""
+a about across all also an and any are as at be been by can for from has have in into is it its
+more of on or our that the their this to was we were which will with within
+""".split())
+_SUFFIXES = (("ations", "ate"), ("ation", "ate"), ("ities", "ity"), ("ments", "ment"), ("ings", ""),
+             ("ing", ""), ("ies", "y"), ("ied", "y"), ("ers", "er"), ("ed", ""), ("es", ""), ("s", ""))
+
+
+# Function to reduce a word to a crude stem so "farmers"/"farming"/"farm" share one term
+@lru_cache(maxsize=65536)
+def stem(word):
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= 4:
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+# Function to split text into stemmed unigram and bigram terms
+def terms(text):
+    words = [stem(word) for word in _TOKEN.findall(text.lower()) if word not in _STOPWORDS]
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+class SemanticSDGModel:
+    def __init__(self, sdg_data):
+        self.sdgs = list(sdg_data)
+        sdg_terms = []
+        for data in sdg_data.values():
+            counts = {}
+            for keyword in data["keywords"]:
+                for term in terms(keyword):
+                    counts[term] = counts.get(term, 0) + KEYWORD_WEIGHT
+            for term in terms(data["description"]):
+                counts[term] = counts.get(term, 0) + 1
+            sdg_terms.append(counts)
+
+        self.vocabulary = {term: i for i, term in enumerate(sorted(set().union(*sdg_terms)))}
+        document_frequency = np.zeros(len(self.vocabulary))
+        for counts in sdg_terms:
+            document_frequency[[self.vocabulary[term] for term in counts]] += 1
+        # Smoothed IDF, as in scikit-learn's TfidfVectorizer
+        self.idf = np.log((1 + len(self.sdgs)) / (1 + document_frequency)) + 1
+
+        rows, cols, values = [], [], []
+        for row, counts in enumerate(sdg_terms):
+            for term, count in counts.items():
+                rows.append(row)
+                cols.append(self.vocabulary[term])
+                values.append(1 + math.log(count))
+        centroids = sparse.csr_matrix((values, (rows, cols)), shape=(len(self.sdgs), len(self.vocabulary)))
+        # Transposed once here so scoring is a plain documents x terms @ terms x SDGs product
+        self.centroids_t = self._normalize(centroids).T.tocsr()
+
+    def _normalize(self, matrix):
+        matrix = matrix.multiply(self.idf).tocsr()
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms) @ matrix
+
+    # Function to build the L2-normalized sparse document x term TF-IDF matrix
+    def document_matrix(self, descriptions):
+        indptr, cols, values = [0], [], []
+        vocabulary = self.vocabulary
+        for project_desc in descriptions:
+            counts = {}
+            for term in terms(project_desc or ""):
+                column = vocabulary.get(term)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+            cols.extend(counts)
+            values.extend(1 + math.log(count) for count in counts.values())
+            indptr.append(len(cols))
+        matrix = sparse.csr_matrix((values, cols, indptr), shape=(len(indptr) - 1, len(vocabulary)))
+        return self._normalize(matrix)
+
+    # Function to compute the document x SDG cosine similarity matrix
+    def similarity_matrix(self, descriptions):
+        return (self.document_matrix(descriptions) @ self.centroids_t).toarray()
+
+    # Function to rank SDGs per document by similarity, dropping those below min_similarity
+    def rank(self, similarities, min_similarity=MIN_SIMILARITY):
+        order = np.argsort(-similarities, axis=1, kind="stable")
+        ranked = []
+        for doc_scores, doc_order in zip(similarities, order):
+            ranked.append([(self.sdgs[i], round(float(doc_scores[i]), 3)) for i in doc_order
+                           if doc_scores[i] >= min_similarity])
+        return ranked
+
+    # Function to score a batch of descriptions and return ranked SDGs per document
+    def match_sdgs_batch(self, descriptions, min_similarity=MIN_SIMILARITY):
+        return self.rank(self.similarity_matrix(descriptions), min_similarity)
+
+    # Function to rank the SDGs for a single description
+    def match_sdgs(self, project_desc, min_similarity=MIN_SIMILARITY):
+        return self.match_sdgs_batch([project_desc], min_similarity)[0]
+
+
+_models = {}
+
+
+# Function to get a semantic model for the given SDG data, built once per process
+def get_semantic_model(sdg_data):
+    key = tuple((sdg, tuple(data["keywords"]), data["description"]) for sdg, data in sdg_data.items())
+    if key not in _models:
+        _models[key] = SemanticSDGModel(sdg_data)
+    return _models[key]
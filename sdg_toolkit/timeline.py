@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+
+# Function to lay out one project's phases: initiation, one implementation phase per 3 months, closure
+def generate_timeline(project_name, start_date, duration, sdgs):
+    timeline = []
+    current_date = start_date
+    
+    # Initial phase
+    timeline.append({
+        "phase": "Project Initiation",
+        "start_date": current_date,
+        "end_date": current_date + timedelta(weeks=4),
+        "description": "Set up project team, define scope, and create detailed project plan.",
+        "sdgs": sdgs
+    })
+    current_date += timedelta(weeks=4)
+    
+    # Implementation phases
+    num_phases = max(1, duration // 3)  # At least one phase, then one phase per 3 months
+    phase_duration = timedelta(days=duration * 30 // num_phases)
+    
+    for i in range(num_phases):
+        timeline.append({
+            "phase": f"Implementation Phase {i+1}",
+            "start_date": current_date,
+            "end_date": current_date + phase_duration,
+            "description": f"Execute project activities related to {', '.join(sdgs[:2])}...",
+            "sdgs": sdgs
+        })
+        current_date += phase_duration
+    
+    # Final phase
+    timeline.append({
+        "phase": "Project Closure",
+        "start_date": current_date,
+        "end_date": current_date + timedelta(weeks=4),
+        "description": "Evaluate project outcomes, document lessons learned, and plan for sustainability.",
+        "sdgs": sdgs
+    })
+    
+    return timeline
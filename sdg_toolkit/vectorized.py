@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .matcher import get_matcher
+
+# Vectorized scoring backend for the SDG Alignment Calculator (Cal_v3 match_sdgs).
+#
+# The keyword lists become a fixed vocabulary and an SDG x keyword weight matrix.
+# A batch of documents is turned into a sparse document x keyword count matrix in
+# one pass each, and every relevance score is produced by a single matrix multiply.
+
+
+class SDGScoringModel:
+    def __init__(self, sdg_data):
+        self.matcher = get_matcher(sdg_data)
+        self.sdgs = list(self.matcher.sdg_keywords)
+        self.vocabulary = {kw: i for i, kw in enumerate(self.matcher.keywords)}
+
+        # A keyword listed twice under one SDG counts twice, as in match_sdgs
+        weights = np.zeros((len(self.sdgs), len(self.vocabulary)), dtype=np.int64)
+        for row, keywords in enumerate(self.matcher.sdg_keywords.values()):
+            for kw in keywords:
+                weights[row, self.vocabulary[kw]] += 1
+        self.weights = sparse.csr_matrix(weights)
+
+    # Function to build the sparse document x keyword count matrix
+    def document_term_matrix(self, descriptions):
+        rows, cols, counts = [], [], []
+        n_docs = 0
+        for doc, project_desc in enumerate(descriptions):
+            for kw, count in self.matcher.count_keywords(project_desc or "").items():
+                rows.append(doc)
+                cols.append(self.vocabulary[kw])
+                counts.append(count)
+            n_docs = doc + 1
+        return sparse.csr_matrix((counts, (rows, cols)), shape=(n_docs, len(self.vocabulary)), dtype=np.int64)
+
+    # Function to compute the document x SDG relevance score matrix
+    def score_matrix(self, descriptions):
+        return (self.document_term_matrix(descriptions) @ self.weights.T).toarray()
+
+    # Function to rank SDGs per document, in the same order match_sdgs returns them
+    def rank(self, scores):
+        # Stable sort keeps registry order between equal scores, like sorted(..., reverse=True)
+        order = np.argsort(-scores, axis=1, kind="stable")
+        ranked = []
+        for doc_scores, doc_order in zip(scores, order):
+            ranked.append([(self.sdgs[i], int(doc_scores[i])) for i in doc_order if doc_scores[i] > 0])
+        return ranked
+
+    # Function to score a batch of descriptions and return ranked SDGs per document
+    def match_sdgs_batch(self, descriptions):
+        return self.rank(self.score_matrix(descriptions))
+
+    # Function to score a DataFrame column, returning one score column per SDG plus the top match
+    def score_dataframe(self, df, text_column):
+        scores = self.score_matrix(df[text_column].fillna("").astype(str))
+        result = pd.DataFrame(scores, index=df.index, columns=self.sdgs)
+        top_score = scores.max(axis=1)
+        top_sdg = np.array(self.sdgs, dtype=object)[scores.argmax(axis=1)]
+        result["Top SDG"] = np.where(top_score > 0, top_sdg, None)
+        result["Top Score"] = top_score
+        return result
+
+
+_models = {}
+
+
+# Function to get a scoring model for the given SDG data, built once per process
+def get_scoring_model(sdg_data):
+    matcher = get_matcher(sdg_data)
+    if id(matcher) not in _models:
+        _models[id(matcher)] = SDGScoringModel(sdg_data)
+    return _models[id(matcher)]
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+# Power/interest prioritization for the Stakeholder Engagement Planner.
+#
+# Every stage works on whole columns: each stakeholder is placed in a
+# power/interest quadrant, ranked by percentile of its combined interest x
+# influence score, and given a suggested engagement intensity. The intensity
+# starts from the quadrant and moves one level up for the top decile of that
+# quadrant and one level down for its bottom decile.
+
+QUADRANTS = ["Monitor", "Keep informed", "Keep satisfied", "Manage closely"]
+INTENSITIES = ["Minimal", "Periodic", "Regular", "Intensive"]
+DEFAULT_THRESHOLD = 5.5
+TOP_PERCENTILE = 90
+BOTTOM_PERCENTILE = 10
+# Quadrants smaller than this keep their base intensity; deciles of a handful of stakeholders mean little
+MIN_QUADRANT_SIZE = 10
+
+
+# Function to add Quadrant, Priority Score, Percentile and Engagement Intensity columns
+def prioritize_stakeholders(df, threshold=DEFAULT_THRESHOLD):
+    df = df.copy()
+    interest = df["Interest"].to_numpy(dtype="float64")
+    influence = df["Influence"].to_numpy(dtype="float64")
+
+    # Quadrant code: bit 0 = high interest, bit 1 = high influence
+    quadrant = (interest >= threshold).astype(np.int8) + 2 * (influence >= threshold).astype(np.int8)
+    score = interest * influence
+    scores = pd.Series(score, index=df.index)
+    percentile = scores.rank(pct=True, method="average").to_numpy() * 100
+    # Ties share their average rank, so a quadrant where everyone scores the same stays at its base level
+    by_quadrant = scores.groupby(quadrant)
+    within = by_quadrant.rank(pct=True, method="average").to_numpy() * 100
+    adjustable = by_quadrant.transform("size").to_numpy() >= MIN_QUADRANT_SIZE
+
+    intensity = quadrant + adjustable * ((within > TOP_PERCENTILE).astype(np.int8) - (within <= BOTTOM_PERCENTILE))
+    intensity = np.clip(intensity, 0, len(INTENSITIES) - 1).astype(np.int8)
+
+    df["Quadrant"] = pd.Categorical.from_codes(quadrant, categories=QUADRANTS)
+    df["Priority Score"] = score
+    df["Percentile"] = percentile.round(1)
+    df["Engagement Intensity"] = pd.Categorical.from_codes(intensity, categories=INTENSITIES, ordered=True)
+    return df
+
+
+# Function to aggregate a prioritized registry by category
+def category_summary(prioritized):
+    grouped = prioritized.groupby("Category", observed=True)
+    summary = grouped.agg(
+        Stakeholders=("Stakeholder", "size"),
+        Interest=("Interest", "mean"),
+        Influence=("Influence", "mean"),
+        Priority=("Priority Score", "mean"),
+    ).round(2)
+    quadrants = pd.crosstab(prioritized["Category"], prioritized["Quadrant"]).reindex(columns=QUADRANTS, fill_value=0)
+    return summary.join(quadrants)
+
+
+# Function to count stakeholders per category and quadrant in long form for a stacked bar chart
+def quadrant_counts(prioritized):
+    counts = prioritized.groupby(["Category", "Quadrant"], observed=True).size().rename("Stakeholders")
+    return counts.reset_index()
@@ -0,0 +1,228 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Columnar stakeholder registry for the Stakeholder Engagement Planner.
+#
+# Stakeholders are kept as per-column lists with Category stored as a code into a
+# fixed category list, so adding one is an append rather than a pd.concat copy.
+# Engagement strategies live in a separate (stakeholder id, strategy code) table
+# instead of a comma-joined string. Indexes by normalized name, category and
+# strategy are updated on every append, so filtering and duplicate detection are
+# set lookups rather than scans over the registry.
+
+STAKEHOLDER_CATEGORIES = [
+    "Government agencies",
+    "Local communities",
+    "NGOs and civil society organizations",
+    "Donors and funders",
+    "Private sector companies",
+    "Academic institutions",
+    "Media",
+    "Beneficiaries",
+    "Project team members",
+    "Other"
+]
+ENGAGEMENT_STRATEGIES = [
+    "Regular meetings",
+    "Workshops and seminars",
+    "Surveys and feedback forms",
+    "Newsletters and reports",
+    "Social media engagement",
+    "Community events",
+    "Focus group discussions",
+    "Advisory committees",
+    "Partnerships and collaborations",
+    "Other"
+]
+COLUMNS = ["Stakeholder", "Category", "Interest", "Influence", "Engagement Strategy"]
+SCORE_COLUMNS = ["Interest", "Influence"]
+LEGACY_SCORE_COLUMN = "Interest/Influence"
+STRATEGY_SEPARATOR = ", "
+
+_CATEGORY_CODES = {name: code for code, name in enumerate(STAKEHOLDER_CATEGORIES)}
+_STRATEGY_CODES = {name: code for code, name in enumerate(ENGAGEMENT_STRATEGIES)}
+
+
+# Function to normalize a stakeholder name for indexing and duplicate detection
+def normalize_name(name):
+    return re.sub(r"\s+", " ", str(name)).strip().casefold()
+
+
+# Function to split a comma-joined strategy string into its strategies
+def split_strategies(value):
+    if isinstance(value, (list, tuple, set)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+# Function to read a stakeholder list from a CSV or Parquet file (path or upload)
+def read_stakeholders(source, name=None):
+    name = (name or getattr(source, "name", None) or str(source)).lower()
+    if name.endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+# Function to check a whole stakeholder list at once; returns (valid rows, table of rejected rows with reasons)
+def validate_stakeholders(df):
+    if LEGACY_SCORE_COLUMN in df.columns:
+        # Older plans recorded a single level; use it for both interest and influence
+        df = df.assign(**{name: df[LEGACY_SCORE_COLUMN] for name in SCORE_COLUMNS if name not in df.columns})
+    missing = [name for name in COLUMNS if name not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    df = df[COLUMNS].copy()
+    df["Stakeholder"] = df["Stakeholder"].astype("string").str.strip()
+    df["Category"] = df["Category"].astype("string").str.strip()
+    for name in SCORE_COLUMNS:
+        df[name] = pd.to_numeric(df[name], errors="coerce")
+    strategies = df["Engagement Strategy"].map(split_strategies)
+    unknown_strategy = strategies.map(lambda items: any(item not in _STRATEGY_CODES for item in items))
+
+    checks = {
+        "missing stakeholder name": df["Stakeholder"].fillna("").eq(""),
+        "unknown category": ~df["Category"].isin(STAKEHOLDER_CATEGORIES).fillna(False).astype(bool),
+        "interest outside 1-10": ~df["Interest"].between(1, 10),
+        "influence outside 1-10": ~df["Influence"].between(1, 10),
+        "no engagement strategy": strategies.map(len).eq(0),
+        "unknown engagement strategy": unknown_strategy,
+    }
+    reasons = pd.Series("", index=df.index)
+    for reason, failed in checks.items():
+        reasons = reasons + failed.map({True: reason + "; ", False: ""})
+    invalid = reasons != ""
+
+    errors = pd.DataFrame({"Row": df.index[invalid] + 1, "Problem": reasons[invalid].str.rstrip("; ")})
+    valid = df[~invalid].reset_index(drop=True)
+    valid["Stakeholder"] = valid["Stakeholder"].astype(object)
+    valid["Category"] = valid["Category"].astype(object)
+    valid["Engagement Strategy"] = strategies[~invalid].reset_index(drop=True)
+    return valid, errors
+
+
+class StakeholderStore:
+    def __init__(self):
+        self.names = []
+        self.category_codes = []
+        self.interest = []
+        self.influence = []
+        # Normalized many-to-many table: one (stakeholder id, strategy code) pair per row
+        self.strategy_ids = []
+        self.strategy_codes = []
+        self.by_name = {}
+        self.by_category = {code: set() for code in range(len(STAKEHOLDER_CATEGORIES))}
+        self.by_strategy = {code: set() for code in range(len(ENGAGEMENT_STRATEGIES))}
+        self._keys = {}
+        self._frame = None
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    # Function to find the id of an existing stakeholder with the same name and category
+    def find_duplicate(self, stakeholder, category):
+        return self._keys.get((normalize_name(stakeholder), _CATEGORY_CODES.get(category)))
+
+    # Function to add one stakeholder; returns (id, added) and skips duplicates unless allowed
+    def append(self, stakeholder, category, interest, influence, strategies, allow_duplicate=False):
+        if category not in _CATEGORY_CODES:
+            raise ValueError(f"Unknown stakeholder category: {category}")
+        strategies = split_strategies(strategies)
+        unknown = [item for item in strategies if item not in _STRATEGY_CODES]
+        if unknown:
+            raise ValueError(f"Unknown engagement strategy: {', '.join(unknown)}")
+
+        existing = self.find_duplicate(stakeholder, category)
+        if existing is not None and not allow_duplicate:
+            return existing, False
+
+        stakeholder_id = len(self.names)
+        name_key = normalize_name(stakeholder)
+        category_code = _CATEGORY_CODES[category]
+        self.names.append(str(stakeholder).strip())
+        self.category_codes.append(category_code)
+        self.interest.append(interest)
+        self.influence.append(influence)
+        for code in dict.fromkeys(_STRATEGY_CODES[item] for item in strategies):
+            self.strategy_ids.append(stakeholder_id)
+            self.strategy_codes.append(code)
+            self.by_strategy[code].add(stakeholder_id)
+        self.by_name.setdefault(name_key, []).append(stakeholder_id)
+        self.by_category[category_code].add(stakeholder_id)
+        self._keys.setdefault((name_key, category_code), stakeholder_id)
+        self._frame = None
+        return stakeholder_id, True
+
+    # Function to add every row of a validated stakeholder frame; returns the number of duplicates skipped
+    def extend(self, df, allow_duplicate=False):
+        skipped = 0
+        for row in zip(df["Stakeholder"], df["Category"], df["Interest"], df["Influence"], df["Engagement Strategy"]):
+            skipped += not self.append(*row, allow_duplicate=allow_duplicate)[1]
+        return skipped
+
+    # Function to get the ids matching every given filter (all stakeholders when none are given)
+    def select_ids(self, name=None, categories=None, strategies=None):
+        ids = None
+        if name:
+            key = normalize_name(name)
+            ids = set(self.by_name.get(key, []))
+            if not ids:
+                # No exact match: fall back to a substring search over the distinct names
+                ids = {i for other, matches in self.by_name.items() if key in other for i in matches}
+        if categories:
+            matched = set().union(*(self.by_category[_CATEGORY_CODES[c]] for c in categories))
+            ids = matched if ids is None else ids & matched
+        if strategies:
+            # A stakeholder matches when it uses any of the requested strategies
+            matched = set().union(*(self.by_strategy[_STRATEGY_CODES[s]] for s in strategies))
+            ids = matched if ids is None else ids & matched
+        if ids is None:
+            return np.arange(len(self))
+        return np.fromiter(sorted(ids), dtype=np.int64, count=len(ids))
+
+    # Function to return the registry rows matching the filters
+    def filter(self, name=None, categories=None, strategies=None):
+        frame = self.to_frame()
+        if not (name or categories or strategies):
+            return frame
+        return frame.iloc[self.select_ids(name, categories, strategies)]
+
+    # Function to get the normalized stakeholder/strategy table
+    def strategy_frame(self):
+        return pd.DataFrame({
+            "Stakeholder ID": np.asarray(self.strategy_ids, dtype=np.int64),
+            "Engagement Strategy": pd.Categorical.from_codes(
+                np.asarray(self.strategy_codes, dtype=np.int8), categories=ENGAGEMENT_STRATEGIES),
+        })
+
+    # Function to count stakeholders per category and per engagement strategy
+    def counts(self):
+        by_category = pd.Series(np.bincount(self.category_codes, minlength=len(STAKEHOLDER_CATEGORIES)),
+                                index=STAKEHOLDER_CATEGORIES, name="Stakeholders")
+        by_strategy = pd.Series(np.bincount(self.strategy_codes, minlength=len(ENGAGEMENT_STRATEGIES)),
+                                index=ENGAGEMENT_STRATEGIES, name="Stakeholders")
+        return by_category, by_strategy
+
+    # Function to build (or reuse) the DataFrame view, with Category as a categorical column
+    def to_frame(self):
+        if self._frame is None:
+            joined = [[] for _ in range(len(self))]
+            for stakeholder_id, code in zip(self.strategy_ids, self.strategy_codes):
+                joined[stakeholder_id].append(ENGAGEMENT_STRATEGIES[code])
+            self._frame = pd.DataFrame({
+                "Stakeholder": self.names,
+                "Category": pd.Categorical.from_codes(
+                    np.asarray(self.category_codes, dtype=np.int8), categories=STAKEHOLDER_CATEGORIES),
+                "Interest": self.interest,
+                "Influence": self.influence,
+                "Engagement Strategy": [STRATEGY_SEPARATOR.join(items) for items in joined],
+            }, columns=COLUMNS)
+        return self._frame
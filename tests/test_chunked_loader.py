@@ -0,0 +1,17 @@
+import io
+
+import pandas as pd
+
+from chunked_loader import summarize_csv
+
+
+def test_sample_stays_categorical_when_chunks_have_different_categories():
+    # The first chunk only has north/south, the later ones east/west/north
+    regions = ["north", "south"] * 50 + ["east", "west", "north"] * 100
+    csv_text = "region,value\n" + "\n".join(f"{region},{i}" for i, region in enumerate(regions))
+
+    summary = summarize_csv(io.StringIO(csv_text), chunk_size=100, sample_rows=150)
+
+    assert isinstance(summary.sample["region"].dtype, pd.CategoricalDtype)
+    assert set(summary.sample["region"].cat.categories) == {"north", "south", "east", "west"}
+    assert summary.impact_score == sum(range(len(regions)))
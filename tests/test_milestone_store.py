@@ -0,0 +1,44 @@
+import datetime
+
+from milestone_store import MilestoneStore
+from sdg_toolkit.timeline import generate_timeline
+
+START = datetime.date(2025, 1, 1)
+SDGS = ["No Poverty"]
+
+
+def _milestones_by_phase(store, project):
+    return {phase["phase"]: phase["milestones"] for phase in store.load_plan(project)}
+
+
+def test_milestones_follow_phase_names_when_plan_gets_shorter(tmp_path):
+    store = MilestoneStore(str(tmp_path / "plans.db"))
+    store.save_timeline("P", generate_timeline("P", START, 12, SDGS))
+    phases = [phase["phase"] for phase in store.load_plan("P")]
+    assert phases[-1] == "Project Closure" and len(phases) == 6
+    store.add_milestones([
+        ("P", 1, "kick-off"),
+        ("P", 2, "first delivery"),
+        ("P", 4, "third delivery"),
+        ("P", 6, "final report"),
+    ])
+
+    # 6 months gives Initiation, Implementation Phases 1-2 and Closure
+    removed = store.save_timeline("P", generate_timeline("P", START, 6, SDGS))
+
+    assert removed == 1
+    assert _milestones_by_phase(store, "P") == {
+        "Project Initiation": ["kick-off"],
+        "Implementation Phase 1": ["first delivery"],
+        "Implementation Phase 2": [],
+        "Project Closure": ["final report"],
+    }
+    store.close()
+
+
+def test_add_milestones_ignores_blank_text_and_unknown_phases(tmp_path):
+    store = MilestoneStore(str(tmp_path / "plans.db"))
+    store.save_timeline("P", generate_timeline("P", START, 3, SDGS))
+    assert store.add_milestones([("P", 1, "  "), ("P", 99, "nowhere"), ("P", 3, "wrap up")]) == 1
+    assert _milestones_by_phase(store, "P")["Project Closure"] == ["wrap up"]
+    store.close()
@@ -0,0 +1,31 @@
+import csv
+
+import pytest
+
+from sdg_batch import read_records
+
+DEFAULT_FIELD_LIMIT = 128 * 1024
+
+
+@pytest.fixture
+def default_field_limit():
+    # Start from the csv module's default, whatever an earlier test raised it to
+    previous = csv.field_size_limit(DEFAULT_FIELD_LIMIT)
+    yield
+    csv.field_size_limit(previous)
+
+
+def test_read_records_accepts_descriptions_over_128_kb(tmp_path, default_field_limit):
+    description = "clean water and sanitation for rural schools " * 4000
+    assert len(description) > DEFAULT_FIELD_LIMIT
+    path = tmp_path / "projects.csv"
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["project_id", "description"])
+        writer.writerow(["1", description])
+        writer.writerow(["2", "food security"])
+
+    records = list(read_records(str(path)))
+
+    assert [record["project_id"] for record in records] == ["1", "2"]
+    assert records[0]["description"] == description
@@ -0,0 +1,205 @@
+import hashlib
+import re
+
+import numpy as np
+import pandas as pd
+
+from sdg_toolkit.registry import SDG_DATA, SDG_NAMES
+
+# Headless timeline generation for a whole project portfolio.
+#
+# generate_timelines takes one row per project and lays out every phase of every
+# project at once with NumPy date arithmetic, following the same phase rules as
+# Project_Timeline_Generator_v1.generate_timeline: a 4-week initiation phase, one
+# implementation phase per 3 months (at least one) splitting duration x 30 days,
+# and a 4-week closure phase. The result is a single DataFrame (or Arrow table)
+# with one row per phase, which can be written out as CSV, Parquet or an
+# iCalendar file.
+
+PROJECT_COLUMNS = ["Project", "Start Date", "Duration (months)", "SDGs"]
+PHASE_COLUMNS = ["Project", "Phase Number", "Phase", "Start Date", "End Date", "Description", "SDGs"]
+# SDG names can contain commas ("Peace, Justice and Strong Institutions"), so lists use semicolons
+SDG_SEPARATOR = "; "
+EDGE_PHASE_DAYS = 28
+MONTHS_PER_PHASE = 3
+DAYS_PER_MONTH = 30
+ICAL_CHUNK_ROWS = 10_000
+
+_SDG_LOOKUP = {name.casefold(): name for name in SDG_DATA}
+_SDG_LOOKUP.update({f"sdg {number}": name for number, name in SDG_NAMES.items()})
+_SDG_LOOKUP.update({str(number): name for number, name in SDG_NAMES.items()})
+
+
+# Function to turn "SDG 3; Quality Education; 13" (or a list) into registry SDG names; unknown entries map to None
+def parse_sdgs(value):
+    if isinstance(value, (list, tuple)):
+        items = value
+    elif value is None or (isinstance(value, float) and np.isnan(value)):
+        items = []
+    else:
+        items = str(value).split(";")
+    names = [_SDG_LOOKUP.get(re.sub(r"\s+", " ", str(item)).strip().casefold()) for item in items if str(item).strip()]
+    return list(dict.fromkeys(names))
+
+
+# Function to read a project portfolio from a CSV or Parquet file (path or upload)
+def read_projects(source, name=None):
+    name = (name or getattr(source, "name", None) or str(source)).lower()
+    if name.endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+# Function to check a whole portfolio at once; returns (valid rows, table of rejected rows with reasons)
+def validate_projects(df):
+    missing = [name for name in PROJECT_COLUMNS if name not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    df = df[PROJECT_COLUMNS].copy()
+    df["Project"] = df["Project"].astype("string").str.strip()
+    df["Start Date"] = pd.to_datetime(df["Start Date"], errors="coerce")
+    df["Duration (months)"] = pd.to_numeric(df["Duration (months)"], errors="coerce")
+    sdgs = df["SDGs"].map(parse_sdgs)
+
+    checks = {
+        "missing project name": df["Project"].fillna("").eq(""),
+        "invalid start date": df["Start Date"].isna(),
+        "duration must be a whole number of months >= 1": ~(df["Duration (months)"] >= 1)
+                                                          | (df["Duration (months)"] % 1 != 0),
+        "no SDGs": sdgs.map(len).eq(0),
+        "unknown SDG": sdgs.map(lambda names: None in names),
+    }
+    reasons = pd.Series("", index=df.index)
+    for reason, failed in checks.items():
+        reasons = reasons + failed.map({True: reason + "; ", False: ""})
+    invalid = reasons != ""
+
+    errors = pd.DataFrame({"Row": df.index[invalid] + 1, "Problem": reasons[invalid].str.rstrip("; ")})
+    valid = df[~invalid].reset_index(drop=True)
+    valid["Project"] = valid["Project"].astype(object)
+    valid["Start Date"] = valid["Start Date"].dt.normalize()
+    valid["Duration (months)"] = valid["Duration (months)"].astype("int64")
+    valid["SDGs"] = sdgs[~invalid].reset_index(drop=True)
+    return valid, errors
+
+
+# Function to lay out the phases of every project in one vectorized pass
+def generate_timelines(projects):
+    durations = projects["Duration (months)"].to_numpy(dtype="int64")
+    starts = pd.to_datetime(projects["Start Date"]).to_numpy(dtype="datetime64[D]")
+    sdgs = [parse_sdgs(value) if not isinstance(value, list) else value for value in projects["SDGs"]]
+
+    num_phases = np.maximum(1, durations // MONTHS_PER_PHASE)
+    phase_days = durations * DAYS_PER_MONTH // num_phases
+    counts = num_phases + 2
+    project_idx = np.repeat(np.arange(len(projects)), counts)
+    first_row = np.cumsum(counts) - counts
+    position = np.arange(counts.sum()) - np.repeat(first_row, counts)
+
+    n = num_phases[project_idx]
+    days = phase_days[project_idx]
+    is_edge = (position == 0) | (position == n + 1)
+    offset = np.where(position == 0, 0, EDGE_PHASE_DAYS + (position - 1) * days)
+    length = np.where(is_edge, EDGE_PHASE_DAYS, days)
+    start_dates = starts[project_idx] + offset.astype("timedelta64[D]")
+
+    implementation = pd.Series(position, dtype="int64").astype(str)
+    phase = np.where(position == 0, "Project Initiation",
+                     np.where(position == n + 1, "Project Closure", "Implementation Phase " + implementation))
+    execute = np.array([f"Execute project activities related to {', '.join(names[:2])}..." for names in sdgs],
+                       dtype=object)
+    description = np.where(position == 0, "Set up project team, define scope, and create detailed project plan.",
+                           np.where(position == n + 1,
+                                    "Evaluate project outcomes, document lessons learned, and plan for sustainability.",
+                                    execute[project_idx]))
+    joined = np.array([SDG_SEPARATOR.join(names) for names in sdgs], dtype=object)
+
+    return pd.DataFrame({
+        "Project": projects["Project"].to_numpy(dtype=object)[project_idx],
+        "Phase Number": position + 1,
+        "Phase": phase.astype(object),
+        "Start Date": start_dates,
+        "End Date": start_dates + length.astype("timedelta64[D]"),
+        "Description": description.astype(object),
+        "SDGs": joined[project_idx],
+    }, columns=PHASE_COLUMNS)
+
+
+# Function to convert a phase table to an Arrow table
+def to_arrow(timelines):
+    import pyarrow as pa
+    return pa.Table.from_pandas(timelines, preserve_index=False)
+
+
+def _ical_escape(values):
+    return (values.astype(str).str.replace("\\", "\\\\", regex=False).str.replace(";", "\\;", regex=False)
+            .str.replace(",", "\\,", regex=False).str.replace("\n", "\\n", regex=False))
+
+
+def _ical_fold(line):
+    # RFC 5545: lines longer than 75 octets continue on the next line after a single space
+    if len(line.encode("utf-8")) <= 75:
+        return line
+    if line.isascii():
+        return "\r\n ".join([line[:75]] + [line[i:i + 74] for i in range(75, len(line), 74)])
+    parts, current = [], ""
+    for char in line:
+        if len((current + char).encode("utf-8")) > (75 if not parts else 74):
+            parts.append(current)
+            current = ""
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def _ical_dates(values):
+    days = pd.to_datetime(values).to_numpy(dtype="datetime64[D]")
+    return np.char.replace(np.datetime_as_string(days), "-", "")
+
+
+def _project_digest(project, digests):
+    if project not in digests:
+        digests[project] = hashlib.sha1(str(project).encode("utf-8")).hexdigest()[:16]
+    return digests[project]
+
+
+# Function to write a phase table as an iCalendar file with one all-day event per phase
+def write_ical(timelines, target, chunk_size=ICAL_CHUNK_ROWS):
+    stamp = pd.Timestamp.now(tz="UTC").strftime("%Y%m%dT%H%M%SZ")
+    digests = {}
+    close = isinstance(target, str)
+    handle = open(target, "w", newline="", encoding="utf-8") if close else target
+    try:
+        handle.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//SDG Toolkit//Project Timeline Generator//EN\r\n")
+        for begin in range(0, len(timelines), chunk_size):
+            chunk = timelines.iloc[begin:begin + chunk_size]
+            summary = _ical_escape(chunk["Project"] + ": " + chunk["Phase"])
+            description = _ical_escape(chunk["Description"] + "\nSDGs: " + chunk["SDGs"])
+            # Row position keeps UIDs unique when two projects share a name
+            uids = [f"{_project_digest(project, digests)}-{row}-{number}@sdg-toolkit" for row, project, number
+                    in zip(range(begin, begin + len(chunk)), chunk["Project"], chunk["Phase Number"])]
+            dtstart = _ical_dates(chunk["Start Date"])
+            dtend = _ical_dates(chunk["End Date"])
+            lines = []
+            for uid, start, end, text, details in zip(uids, dtstart, dtend, summary, description):
+                lines.extend([
+                    "BEGIN:VEVENT", f"UID:{uid}", f"DTSTAMP:{stamp}", f"DTSTART;VALUE=DATE:{start}",
+                    f"DTEND;VALUE=DATE:{end}", _ical_fold(f"SUMMARY:{text}"), _ical_fold(f"DESCRIPTION:{details}"),
+                    "END:VEVENT",
+                ])
+            handle.write("\r\n".join(lines) + "\r\n")
+        handle.write("END:VCALENDAR\r\n")
+    finally:
+        if close:
+            handle.close()
+
+
+# Function to write a phase table as CSV, Parquet or iCalendar
+def write_timelines(timelines, target, file_format="csv"):
+    if file_format == "ics":
+        write_ical(timelines, target)
+    elif file_format == "parquet":
+        timelines.to_parquet(target, index=False)
+    else:
+        timelines.to_csv(target, index=False, date_format="%Y-%m-%d")
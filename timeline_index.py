@@ -0,0 +1,155 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from timeline_batch import PHASE_COLUMNS, SDG_SEPARATOR, parse_sdgs
+
+# Portfolio-wide queries over many projects' timelines.
+#
+# PhaseIndex keeps every phase as a half-open [start, end) interval of days,
+# sorted by start. An overlap query only looks at the phases whose start falls in
+# [query start - longest phase, query end), found with two binary searches, so it
+# never scans the whole portfolio. Concurrent-phase load per SDG per month is a
+# sweep line: each phase adds +1 at its first month and -1 after its last, and a
+# cumulative sum over months gives the number of phases active in each month.
+# Nothing is compared pairwise.
+
+GANTT_MAX_PHASES = 2_000
+
+
+# Function to turn generate_timeline output ({project: [phase dicts]} or dicts with a "project" key) into a phase table
+def phases_to_frame(phases):
+    if isinstance(phases, pd.DataFrame):
+        return phases
+    if isinstance(phases, dict):
+        phases = [dict(phase, project=project, phase_number=number) for project, timeline in phases.items()
+                  for number, phase in enumerate(timeline, start=1)]
+    rows = []
+    for number, phase in enumerate(phases, start=1):
+        sdgs = phase.get("sdgs", [])
+        rows.append({
+            "Project": phase.get("project", ""),
+            "Phase Number": phase.get("phase_number", number),
+            "Phase": phase["phase"],
+            "Start Date": pd.Timestamp(phase["start_date"]),
+            "End Date": pd.Timestamp(phase["end_date"]),
+            "Description": phase.get("description", ""),
+            "SDGs": sdgs if isinstance(sdgs, str) else SDG_SEPARATOR.join(sdgs),
+        })
+    return pd.DataFrame(rows, columns=PHASE_COLUMNS)
+
+
+def _to_day(value):
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+class PhaseIndex:
+    def __init__(self, phases):
+        frame = phases_to_frame(phases)
+        starts = pd.to_datetime(frame["Start Date"]).to_numpy(dtype="datetime64[D]")
+        order = np.argsort(starts, kind="stable")
+        self.phases = frame.iloc[order].reset_index(drop=True)
+        self.starts = starts[order]
+        self.ends = pd.to_datetime(self.phases["End Date"]).to_numpy(dtype="datetime64[D]")
+        lengths = self.ends - self.starts
+        self.max_length = lengths.max() if len(lengths) else np.timedelta64(0, "D")
+        self._sdg_phase = None
+
+    def __len__(self):
+        return len(self.phases)
+
+    # Function to get the positions of phases overlapping [start, end)
+    def overlapping(self, start, end=None):
+        start = _to_day(start)
+        end = start + np.timedelta64(1, "D") if end is None else _to_day(end)
+        lo = np.searchsorted(self.starts, start - self.max_length, side="left")
+        hi = np.searchsorted(self.starts, end, side="left")
+        window = np.arange(lo, hi)
+        return window[self.ends[lo:hi] > start]
+
+    # Function to list the phases active on a date or during [start, end)
+    def active(self, start, end=None):
+        return self.phases.iloc[self.overlapping(start, end)]
+
+    # Function to list the phases active during ISO week `week` of `year`
+    def active_in_week(self, year, week):
+        monday = datetime.date.fromisocalendar(year, week, 1)
+        return self.active(monday, monday + datetime.timedelta(days=7))
+
+    def _sdg_pairs(self):
+        # One (phase position, SDG) pair per SDG a phase serves, built once per index
+        if self._sdg_phase is None:
+            phase_pos, names = [], []
+            for pos, value in enumerate(self.phases["SDGs"]):
+                for name in parse_sdgs(value):
+                    if name is not None:
+                        phase_pos.append(pos)
+                        names.append(name)
+            self._sdg_phase = (np.asarray(phase_pos, dtype=np.int64), pd.Categorical(names))
+        return self._sdg_phase
+
+    # Function to count the phases active in each month for every SDG (months x SDGs)
+    def monthly_load(self, start=None, end=None):
+        phase_pos, sdgs = self._sdg_pairs()
+        if len(phase_pos) == 0:
+            return pd.DataFrame()
+        first = self.starts[phase_pos].astype("datetime64[M]")
+        # Ends are exclusive, so the last active day is end - 1
+        last = (self.ends[phase_pos] - np.timedelta64(1, "D")).astype("datetime64[M]")
+        origin = first.min() if start is None else np.datetime64(pd.Timestamp(start).date(), "M")
+        final = last.max() if end is None else np.datetime64(pd.Timestamp(end).date(), "M")
+        months = int((final - origin).astype(int)) + 1
+        if months <= 0:
+            return pd.DataFrame(columns=sdgs.categories)
+
+        first_idx = np.clip((first - origin).astype(int), 0, months)
+        last_idx = np.clip((last - origin).astype(int) + 1, 0, months)
+        keep = last_idx > first_idx
+        events = np.zeros((len(sdgs.categories), months + 1), dtype=np.int64)
+        np.add.at(events, (sdgs.codes[keep], first_idx[keep]), 1)
+        np.add.at(events, (sdgs.codes[keep], last_idx[keep]), -1)
+        load = np.cumsum(events[:, :months], axis=1)
+
+        index = pd.period_range(pd.Period(origin, "M"), periods=months, freq="M").to_timestamp()
+        return pd.DataFrame(load.T, index=index, columns=list(sdgs.categories))
+
+    # Function to find each SDG's peak number of simultaneously active phases, to the day
+    def peak_concurrency(self):
+        phase_pos, sdgs = self._sdg_pairs()
+        if len(phase_pos) == 0:
+            return pd.Series(dtype="int64", name="Peak Concurrent Phases")
+        days = np.concatenate([self.starts[phase_pos], self.ends[phase_pos]]).astype(np.int64)
+        delta = np.concatenate([np.ones(len(phase_pos), dtype=np.int64), -np.ones(len(phase_pos), dtype=np.int64)])
+        codes = np.concatenate([sdgs.codes, sdgs.codes])
+        # Sort by SDG, then day, with ends (-1) before starts (+1) on the same day since intervals are half-open.
+        # Every SDG's events sum to zero, so one running total restarts at 0 at each SDG boundary.
+        order = np.lexsort((delta, days, codes))
+        running = np.cumsum(delta[order])
+        group_starts = np.r_[0, np.flatnonzero(np.diff(codes[order])) + 1]
+        peaks = np.maximum.reduceat(running, group_starts)
+        return pd.Series(peaks, index=list(sdgs.categories[codes[order][group_starts]]),
+                         name="Peak Concurrent Phases")
+
+
+# Function to list the (month, SDG) cells whose load exceeds a capacity
+def overloaded_months(load, capacity):
+    cells = load.stack()
+    over = cells[cells > capacity]
+    return over.rename("Active Phases").rename_axis(["Month", "SDG"]).reset_index()
+
+
+# Function to draw a Gantt chart of the phases active during [start, end), capped at max_phases bars
+def gantt_figure(index, start=None, end=None, max_phases=GANTT_MAX_PHASES):
+    import plotly.express as px
+    if start is None:
+        phases = index.phases
+    else:
+        phases = index.active(start, end)
+    truncated = len(phases) > max_phases
+    phases = phases.iloc[:max_phases]
+    stage = np.where(phases["Phase"].str.startswith("Implementation"), "Implementation", phases["Phase"])
+    fig = px.timeline(phases.assign(Stage=stage), x_start="Start Date", x_end="End Date", y="Project", color="Stage",
+                      hover_data=["Phase", "SDGs"], title="Portfolio Gantt Chart")
+    fig.update_yaxes(autorange="reversed")
+    return fig, truncated